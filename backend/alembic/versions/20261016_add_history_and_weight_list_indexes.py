@@ -0,0 +1,43 @@
+"""add ban history and post weight list indexes
+
+Revision ID: 20261016_add_history_and_weight_list_indexes
+Revises: 20261016_convert_json_columns_to_jsonb
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_add_history_and_weight_list_indexes"
+down_revision = "20261016_convert_json_columns_to_jsonb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # Both tables are created by init_db (create_all) rather than a migration
+    if inspector.has_table("ban_his"):
+        op.create_index(
+            "ix_ban_his_user_id_created_at",
+            "ban_his",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+            if_not_exists=True,
+        )
+    if inspector.has_table("post_weights"):
+        op.create_index(
+            "ix_post_weights_active_updated_at_id",
+            "post_weights",
+            [sa.text("updated_at DESC"), sa.text("id DESC")],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_post_weights_active_updated_at_id", table_name="post_weights", if_exists=True)
+    op.drop_index("ix_ban_his_user_id_created_at", table_name="ban_his", if_exists=True)
@@ -0,0 +1,62 @@
+"""add pair review indexes
+
+Revision ID: 20261016_add_pair_review_indexes
+Revises: 20240926_add_support_chat_status
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_add_pair_review_indexes"
+down_revision = "20240926_add_support_chat_status"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # pair 为上游业务热表：CONCURRENTLY 建索引不阻塞写入，但不能在事务内执行
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pair_status_creator_id",
+            "pair",
+            ["status", "creator_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pair_status_created_at",
+            "pair",
+            ["status", sa.text("created_at DESC NULLS LAST"), sa.text("id DESC")],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pair_base_symbol_trgm",
+            "pair",
+            ["base_symbol"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"base_symbol": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_pair_base_name_trgm",
+            "pair",
+            ["base_name"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"base_name": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_pair_base_name_trgm", table_name="pair", postgresql_concurrently=True)
+        op.drop_index("ix_pair_base_symbol_trgm", table_name="pair", postgresql_concurrently=True)
+        op.drop_index("ix_pair_status_created_at", table_name="pair", postgresql_concurrently=True)
+        op.drop_index("ix_pair_status_creator_id", table_name="pair", postgresql_concurrently=True)
@@ -0,0 +1,33 @@
+"""add support case keyset index
+
+Revision ID: 20261016_add_support_case_keyset_index
+Revises: 20261016_add_pair_review_indexes
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_add_support_case_keyset_index"
+down_revision = "20261016_add_pair_review_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # support_cases is created by init_db (create_all) rather than a migration
+    if not sa.inspect(op.get_bind()).has_table("support_cases"):
+        return
+    op.create_index(
+        "ix_support_cases_created_at_id",
+        "support_cases",
+        [sa.text("created_at DESC"), sa.text("id DESC")],
+        unique=False,
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_support_cases_created_at_id", table_name="support_cases", if_exists=True)
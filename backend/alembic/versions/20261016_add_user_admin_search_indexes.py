@@ -0,0 +1,69 @@
+"""add admin search indexes on authors, user_wallet and bans
+
+Revision ID: 20261016_add_user_admin_search_indexes
+Revises: 20261016_drop_redundant_prefix_indexes
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_add_user_admin_search_indexes"
+down_revision = "20261016_drop_redundant_prefix_indexes"
+branch_labels = None
+depends_on = None
+
+
+def _trgm_index(name: str, table: str, column: str) -> None:
+    op.create_index(
+        name,
+        table,
+        [column],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+        postgresql_concurrently=True,
+        if_not_exists=True,
+    )
+
+
+def _drop_index(name: str, table: str) -> None:
+    op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # authors / user_wallet / bans 为上游业务热表：CONCURRENTLY 建索引不阻塞写入，
+    # 但不能在事务内执行，因此放在 autocommit 块中
+    with op.get_context().autocommit_block():
+        _trgm_index("ix_authors_username_trgm", "authors", "username")
+        _trgm_index("ix_authors_name_trgm", "authors", "name")
+        _trgm_index("ix_user_wallet_pubkey_trgm", "user_wallet", "pubkey")
+        op.create_index(
+            "ix_user_wallet_user_id_created_at",
+            "user_wallet",
+            ["user_id", sa.text("created_at DESC NULLS LAST")],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_bans_user_id_unrevoked",
+            "bans",
+            ["user_id", "ends_at"],
+            unique=False,
+            postgresql_where=sa.text("revoked_at IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        _drop_index("ix_bans_user_id_unrevoked", "bans")
+        _drop_index("ix_user_wallet_user_id_created_at", "user_wallet")
+        _drop_index("ix_user_wallet_pubkey_trgm", "user_wallet")
+        _drop_index("ix_authors_name_trgm", "authors")
+        _drop_index("ix_authors_username_trgm", "authors")
@@ -0,0 +1,55 @@
+"""convert app-owned json columns to jsonb
+
+Revision ID: 20261016_convert_json_columns_to_jsonb
+Revises: 20261016_add_support_case_keyset_index
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_convert_json_columns_to_jsonb"
+down_revision = "20261016_add_support_case_keyset_index"
+branch_labels = None
+depends_on = None
+
+# images / videos / pair already store JSONB upstream; only these tables are ours
+_COLUMNS = (
+    ("operator_audit_logs", "action_details"),
+    ("support_conversations", "messages"),
+)
+
+
+def _column_type(inspector, table: str, column: str):
+    for info in inspector.get_columns(table):
+        if info["name"] == column:
+            return info["type"]
+    return None
+
+
+def _convert(target_type, cast: str) -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, column in _COLUMNS:
+        # Tables are created by init_db (create_all) rather than a migration
+        if not inspector.has_table(table):
+            continue
+        current = _column_type(inspector, table, column)
+        if current is None or type(current) is type(target_type):
+            continue
+        op.alter_column(
+            table,
+            column,
+            type_=target_type,
+            postgresql_using=f"{column}::{cast}",
+        )
+
+
+def upgrade() -> None:
+    _convert(postgresql.JSONB(), "jsonb")
+
+
+def downgrade() -> None:
+    _convert(postgresql.JSON(), "json")
@@ -0,0 +1,40 @@
+"""drop single-column indexes covered by composite indexes
+
+Revision ID: 20261016_drop_redundant_prefix_indexes
+Revises: 20261016_add_history_and_weight_list_indexes
+Create Date: 2026-10-16 00:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "20261016_drop_redundant_prefix_indexes"
+down_revision = "20261016_add_history_and_weight_list_indexes"
+branch_labels = None
+depends_on = None
+
+# (index, table, column, covering composite index)
+_REDUNDANT = (
+    ("ix_ban_his_user_id", "ban_his", "user_id", "ix_ban_his_user_id_created_at"),
+    ("ix_pair_status", "pair", "status", "ix_pair_status_created_at"),
+)
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table, _column, covering in _REDUNDANT:
+        if not inspector.has_table(table):
+            continue
+        # Only drop once the composite index that takes over its lookups exists
+        if covering not in {ix["name"] for ix in inspector.get_indexes(table)}:
+            continue
+        op.drop_index(index_name, table_name=table, if_exists=True)
+
+
+def downgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for index_name, table, column, _covering in _REDUNDANT:
+        if inspector.has_table(table):
+            op.create_index(index_name, table, [column], unique=False, if_not_exists=True)
@@ -1,5 +1,6 @@
 """Configuration management API."""
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from pydantic import TypeAdapter
 
 from app.auth import get_operator_context
 from app.database import get_db
@@ -13,22 +14,31 @@ from app.schemas.configuration import (
     StartupModeUpdateRequest,
 )
 from app.services.configuration_service import ConfigurationService
+from app.utils.http_cache import PUBLIC_CACHE_CONTROL, conditional_json_response
+from app.utils.pagination import DEPRECATION_HEADER, PageQuery, PageSizeQuery
 
-router = APIRouter()
+router = APIRouter(generate_unique_id_function=lambda route: f"configuration_{route.name}")
+
+_STARTUP_MODES_ADAPTER = TypeAdapter(Response[StartupModeListResponse])
+_APP_VERSIONS_ADAPTER = TypeAdapter(Response[AppVersionConfigResponse])
 
 
 @router.get("/web3-display-version", response_model=Response[StartupModeListResponse])
 async def list_startup_modes(
+    request: Request,
     os: str | None = Query(None, description="Filter by operating system, e.g. ios/android"),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of records returned"),
-    offset: int = Query(0, ge=0, description="Number of records to skip for pagination"),
+    offset: int = Query(0, ge=0, description="Deprecated: use cursor instead"),
     db=Depends(get_db),
 ):
     """List startup modes for Web3 display configuration."""
+    headers = {DEPRECATION_HEADER: "true"} if cursor is None and offset else None
     service = ConfigurationService(db)
     # Mode is fixed to 'normal' for this API.
-    data = await service.list_startup_modes("strict", os, limit, offset)
-    return Response(data=data)
+    data = await service.list_startup_modes("strict", os, limit, offset, cursor)
+    body = _STARTUP_MODES_ADAPTER.dump_json(Response[StartupModeListResponse](data=data))
+    return conditional_json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL, headers=headers)
 
 
 @router.post(
@@ -52,8 +62,9 @@ async def create_startup_mode(
     include_in_schema=False,
 )
 async def get_app_versions(
-    page: int = Query(1, ge=1, description="Page index (1-based)"),
-    page_size: int = Query(10, ge=1, le=100, description="Page size"),
+    request: Request,
+    page: PageQuery = 1,
+    page_size: PageSizeQuery = 10,
     db=Depends(get_db),
 ):
     """Get current app version configuration stored in this service."""
@@ -61,7 +72,8 @@ async def get_app_versions(
     # Currently pagination is not applied to the aggregated response,
     # but parameters are reserved for future extension.
     data = await service.get_app_version_config(page=page, page_size=page_size)
-    return Response(data=data)
+    body = _APP_VERSIONS_ADAPTER.dump_json(Response[AppVersionConfigResponse](data=data))
+    return conditional_json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
 
 
 @router.get(
@@ -69,10 +81,11 @@ async def get_app_versions(
     response_model=Response[AppVersionConfigResponse],
     summary="Get latest optional/mandatory app versions for iOS and Android",
 )
-async def get_app_versions_latest(db=Depends(get_db)):
+async def get_app_versions_latest(request: Request, db=Depends(get_db)):
     service = ConfigurationService(db)
     data = await service.get_app_version_config()
-    return Response(data=data)
+    body = _APP_VERSIONS_ADAPTER.dump_json(Response[AppVersionConfigResponse](data=data))
+    return conditional_json_response(request, body, cache_control=PUBLIC_CACHE_CONTROL)
 
 
 @router.put("/upgrade/app-versions", response_model=Response[AppVersionConfigResponse])
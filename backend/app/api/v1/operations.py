@@ -1,6 +1,7 @@
 """Operations API routes - Meme review from database (posts/pair)."""
 from typing import List, Optional
 from fastapi import APIRouter, Depends, Query, Path, HTTPException
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.meme import (
@@ -19,11 +20,17 @@ from app.schemas.post_weight import (
 from app.services.meme_service import MemeService
 from app.services.post_weight_service import PostWeightService
 from app.auth import get_operator_context
+from app.utils.pagination import DEPRECATION_HEADER, PageQuery, PageSizeQuery
+from app.utils.responses import adapter_response
 import logging
 
-router = APIRouter()
+router = APIRouter(generate_unique_id_function=lambda route: f"operations_{route.name}")
 logger = logging.getLogger(__name__)
 
+# Serializers for hot list responses, built once at import time
+_MEMES_ADAPTER = TypeAdapter(Response[MemeReviewListResponse])
+_POST_WEIGHTS_ADAPTER = TypeAdapter(Response[PostWeightListResponse])
+
 
 # Meme Review Routes (from DB)
 @router.get("/memes/review", response_model=Response[MemeReviewListResponse])
@@ -32,8 +39,8 @@ async def get_memes_for_review(
     creator_name: Optional[str] = Query(None, description="Filter by creator display name"),
     symbol: Optional[str] = Query(None, description="Filter by meme symbol"),
     name: Optional[str] = Query(None, description="Filter by meme name"),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=100),
+    page: PageQuery = 1,
+    page_size: PageSizeQuery = 10,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -51,7 +58,8 @@ async def get_memes_for_review(
     meme_service = MemeService(db)
     result = await meme_service.get_pending_memes(params)
 
-    return Response(data=result)
+    # 服务层已返回校验过的模型，直接输出，跳过 response_model 的二次校验
+    return adapter_response(_MEMES_ADAPTER, Response[MemeReviewListResponse](data=result))
 
 
 @router.get("/memes/{order_id}", response_model=Response[dict])
@@ -128,14 +136,17 @@ async def create_post_weights(
     summary="List post weight records",
 )
 async def list_post_weights(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor"),
+    page: int = Query(1, ge=1, description="Deprecated: use cursor instead"),
     page_size: int = Query(20, ge=1, le=200),
     db: AsyncSession = Depends(get_db),
 ):
     """Retrieve existing post weight configurations."""
+    headers = {DEPRECATION_HEADER: "true"} if cursor is None and page > 1 else None
     service = PostWeightService(db)
-    result = await service.list_post_weights(page, page_size)
-    return Response(message="Post weights fetched", data=result)
+    result = await service.list_post_weights(page, page_size, cursor)
+    payload = Response[PostWeightListResponse](message="Post weights fetched", data=result)
+    return adapter_response(_POST_WEIGHTS_ADAPTER, payload, headers=headers)
 
 
 @router.post(
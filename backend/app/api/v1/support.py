@@ -1,7 +1,10 @@
 """Support API routes for conversation state management."""
-from typing import Literal
+from functools import lru_cache
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, File, Path, Query, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
+from pydantic import TypeAdapter
+from starlette.datastructures import UploadFile as StarletteUploadFile
 
 from app.auth import get_operator_context
 from app.config import settings
@@ -28,8 +31,24 @@ from app.schemas.support import (
     SupportCaseItem,
 )
 from app.services.support_service import SupportService, SupportQuickMessageService
+from app.utils.http_cache import compute_etag, conditional_json_response
+from app.utils.pagination import DEPRECATION_HEADER, PageQuery, PageSizeQuery
+from app.utils.responses import adapter_response
+from app.utils.singleflight import SingleFlight
 
-router = APIRouter()
+router = APIRouter(generate_unique_id_function=lambda route: f"support_{route.name}")
+
+_CONVERSATIONS_ADAPTER = TypeAdapter(Response[SupportConversationListResponse])
+_CONVERSATION_DETAIL_ADAPTER = TypeAdapter(Response[SupportConversationDetailResponse])
+_QUICK_MESSAGES_ADAPTER = TypeAdapter(Response[SupportQuickMessageListResponse])
+_CASES_ADAPTER = TypeAdapter(Response[SupportCaseListResponse])
+_CASE_ADAPTER = TypeAdapter(Response[SupportCaseItem])
+_SUPPORTERS_ADAPTER = TypeAdapter(Response[SupporterListResponse])
+_IM_LOOKUP_ADAPTER = TypeAdapter(Response[SupportImLookupResponse])
+_QUICK_MESSAGE_ADAPTER = TypeAdapter(Response[SupportQuickMessageItem])
+
+# Concurrent detail requests for the same conversation share one lookup
+_conversation_detail_flight: SingleFlight[bytes] = SingleFlight()
 
 
 # ----------------------------- Chat list & status ----------------------------- #
@@ -41,18 +60,25 @@ router = APIRouter()
     summary="List chats (OpenIM + local status)",
     include_in_schema=False,
 )
+@router.get(
+    "/conversations",
+    response_model=Response[SupportConversationListResponse],
+    include_in_schema=False,
+)
 async def list_chat_sessions(
+    request: Request,
     status: Literal["pending", "processed"] | None = Query(None, description="Filter by status"),
     uid: str | None = Query(None, description="Fuzzy user id"),
     username: str | None = Query(None),
     display_name: str | None = Query(None),
     wallet_address: str | None = Query(None),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=100),
+    page: PageQuery = 1,
+    page_size: PageSizeQuery = 10,
     db=Depends(get_db),
 ):
     """Fetch OpenIM conversation list, merge local status, return list + status only."""
-    query = SupportConversationQuery(
+    # 参数已由路由声明校验，直接构造跳过二次校验
+    query = SupportConversationQuery.model_construct(
         status=status,
         uid=uid,
         username=username,
@@ -62,8 +88,11 @@ async def list_chat_sessions(
         page_size=page_size,
     )
     service = SupportService(db)
-    data = await service.list_conversations(query)
-    return Response(data=data)
+    body = await service.list_conversations_body(
+        query,
+        lambda data: _CONVERSATIONS_ADAPTER.dump_json(Response[SupportConversationListResponse](data=data)),
+    )
+    return conditional_json_response(request, body)
 
 
 @router.patch(
@@ -72,13 +101,18 @@ async def list_chat_sessions(
     summary="Update chat status (pending/processed)",
     include_in_schema=False,
 )
+@router.post(
+    "/conversations/{conversation_id}/status",
+    response_model=Response[dict],
+    include_in_schema=False,
+)
 async def patch_chat_status(
     conversation_id: str,
     payload: SupportConversationStatusUpdateRequest,
     operator_ctx=Depends(get_operator_context),
     db=Depends(get_db),
 ):
-    """Update local chat status only; no message persistence."""
+    """Update local chat status only (operator clicks End/Later); no message persistence."""
     service = SupportService(db)
     await service.update_status(
         conversation_id,
@@ -102,7 +136,7 @@ async def create_support_case(
 ):
     service = SupportService(db)
     item = await service.create_case(payload)
-    return Response(message="Support case created", data=item)
+    return adapter_response(_CASE_ADAPTER, Response[SupportCaseItem](message="Support case created", data=item))
 
 
 @router.get(
@@ -112,13 +146,21 @@ async def create_support_case(
 async def list_support_cases(
     status: str | None = Query(None, description="Filter by status, e.g. open/closed"),
     user_id: str | None = Query(None, description="Filter by user id"),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=100),
+    cursor: str | None = Query(None, description="Opaque cursor returned as next_cursor"),
+    page: Annotated[int, Query(ge=1, description="Deprecated: use cursor instead")] = 1,
+    page_size: PageSizeQuery = 10,
     db=Depends(get_db),
 ):
+    headers = {DEPRECATION_HEADER: "true"} if cursor is None and page > 1 else None
     service = SupportService(db)
-    data = await service.list_cases(page=page, page_size=page_size, status=status, user_id=user_id)
-    return Response(data=data)
+    data = await service.list_cases(
+        page=page,
+        page_size=page_size,
+        status=status,
+        user_id=user_id,
+        cursor=cursor,
+    )
+    return adapter_response(_CASES_ADAPTER, Response[SupportCaseListResponse](data=data), headers=headers)
 
 
 @router.get(
@@ -126,12 +168,13 @@ async def list_support_cases(
     response_model=Response[SupportCaseItem],
 )
 async def get_support_case(
+    request: Request,
     case_id: str,
     db=Depends(get_db),
 ):
     service = SupportService(db)
     item = await service.get_case(case_id)
-    return Response(data=item)
+    return conditional_json_response(request, _CASE_ADAPTER.dump_json(Response[SupportCaseItem](data=item)))
 
 
 @router.put(
@@ -145,7 +188,7 @@ async def update_support_case(
 ):
     service = SupportService(db)
     item = await service.update_case(case_id, payload)
-    return Response(message="Support case updated", data=item)
+    return adapter_response(_CASE_ADAPTER, Response[SupportCaseItem](message="Support case updated", data=item))
 
 
 @router.delete(
@@ -176,71 +219,25 @@ async def create_or_update_conversation(
     return Response(message="Conversation saved", data=result)
 
 
-@router.get(
-    "/conversations",
-    response_model=Response[SupportConversationListResponse],
-    include_in_schema=False,
-)
-async def list_conversations(
-    status: Literal["pending", "processed"] | None = Query(None, description="pending/processed"),
-    uid: str | None = Query(None, description="Fuzzy user id"),
-    username: str | None = Query(None),
-    display_name: str | None = Query(None),
-    wallet_address: str | None = Query(None),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=100),
-    db=Depends(get_db),
-):
-    """List conversations with pagination."""
-    query = SupportConversationQuery(
-        status=status,
-        uid=uid,
-        username=username,
-        display_name=display_name,
-        wallet_address=wallet_address,
-        page=page,
-        page_size=page_size,
-    )
-    service = SupportService(db)
-    data = await service.list_conversations(query)
-    return Response(data=data)
-
-
 @router.get(
     "/conversations/{conversation_id}",
     response_model=Response[SupportConversationDetailResponse],
     include_in_schema=False,
 )
 async def get_conversation_detail(
+    request: Request,
     conversation_id: str = Path(..., description="Conversation ID"),
     db=Depends(get_db),
 ):
     """Get conversation detail and user profile."""
     service = SupportService(db)
-    detail = await service.get_conversation_detail(conversation_id)
-    return Response(data=detail)
 
+    async def render() -> bytes:
+        detail = await service.get_conversation_detail(conversation_id)
+        return _CONVERSATION_DETAIL_ADAPTER.dump_json(Response[SupportConversationDetailResponse](data=detail))
 
-@router.post(
-    "/conversations/{conversation_id}/status",
-    response_model=Response[dict],
-    include_in_schema=False,
-)
-async def update_conversation_status(
-    conversation_id: str,
-    payload: SupportConversationStatusUpdateRequest,
-    operator_ctx=Depends(get_operator_context),
-    db=Depends(get_db),
-):
-    """Update conversation status when operator clicks End/Later."""
-    service = SupportService(db)
-    await service.update_status(
-        conversation_id,
-        payload,
-        operator_ctx.operator_id,
-        operator_ctx.operator_name,
-    )
-    return Response(message="Status updated")
+    body = await _conversation_detail_flight.do(conversation_id, render)
+    return conditional_json_response(request, body)
 
 
 @router.post("/im-mapping", response_model=Response[SupportImLookupResponse])
@@ -251,17 +248,27 @@ async def lookup_users_by_im_id(
     """Batch map OpenIM im_id to user profiles."""
     service = SupportService(db)
     data = await service.lookup_users_by_im_ids(payload.im_ids)
-    return Response(data=data)
+    return adapter_response(_IM_LOOKUP_ADAPTER, Response[SupportImLookupResponse](data=data))
 
 
-@router.get("/supporters", response_model=Response[SupporterListResponse])
-async def get_supporter_list():
-    """Get supporter admin list from config."""
+@lru_cache(maxsize=1)
+def _supporter_list_body() -> tuple[bytes, str]:
+    """Supporters come from static settings, so the payload and its ETag are built once per process."""
     supporters = settings.SUPPORT_SUPER_ADMINS or []
-    return Response(
-        data=SupporterListResponse(supporters=supporters),
-        message="Supporter list fetched",
+    body = _SUPPORTERS_ADAPTER.dump_json(
+        Response[SupporterListResponse](
+            data=SupporterListResponse(supporters=supporters),
+            message="Supporter list fetched",
+        )
     )
+    return body, compute_etag(body)
+
+
+@router.get("/supporters", response_model=Response[SupporterListResponse])
+async def get_supporter_list(request: Request):
+    """Get supporter admin list from config."""
+    body, etag = _supporter_list_body()
+    return conditional_json_response(request, body, etag=etag)
 
 
 # ----------------------------- Quick messages ----------------------------- #
@@ -272,12 +279,14 @@ async def get_supporter_list():
     response_model=Response[SupportQuickMessageListResponse],
 )
 async def list_quick_messages(
+    request: Request,
     active_only: bool = Query(False, description="Return enabled quick messages only"),
     db=Depends(get_db),
 ):
     service = SupportQuickMessageService(db)
     data = await service.list_quick_messages(active_only)
-    return Response(data=data)
+    body = _QUICK_MESSAGES_ADAPTER.dump_json(Response[SupportQuickMessageListResponse](data=data))
+    return conditional_json_response(request, body)
 
 
 @router.post(
@@ -291,7 +300,10 @@ async def create_quick_message(
 ):
     service = SupportQuickMessageService(db)
     item = await service.create_quick_message(payload, operator_ctx.operator_id)
-    return Response(message="Quick message created", data=item)
+    return adapter_response(
+        _QUICK_MESSAGE_ADAPTER,
+        Response[SupportQuickMessageItem](message="Quick message created", data=item),
+    )
 
 
 @router.put(
@@ -306,7 +318,10 @@ async def update_quick_message(
 ):
     service = SupportQuickMessageService(db)
     item = await service.update_quick_message(message_id, payload, operator_ctx.operator_id)
-    return Response(message="Quick message updated", data=item)
+    return adapter_response(
+        _QUICK_MESSAGE_ADAPTER,
+        Response[SupportQuickMessageItem](message="Quick message updated", data=item),
+    )
 
 
 @router.delete(
@@ -323,21 +338,43 @@ async def delete_quick_message(
     return Response(message="Quick message deleted", data={})
 
 
+# multipart 边界与表单头的余量
+_UPLOAD_ENVELOPE_BYTES = 64 * 1024
+
+
 @router.post(
     "/quick-messages/upload",
     response_model=Response[SupportQuickMessageUploadResponse],
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "required": ["file"],
+                        "properties": {"file": {"type": "string", "format": "binary", "description": "Image file"}},
+                    }
+                }
+            },
+        }
+    },
 )
 async def upload_quick_message_image(
-    file: UploadFile = File(..., description="Image file"),
+    request: Request,
     operator_ctx=Depends(get_operator_context),
     db=Depends(get_db),
 ):
-    data = await file.read()
-    service = SupportQuickMessageService(db)
-    result = await service.upload_image(
-        operator_id=operator_ctx.operator_id,
-        filename=file.filename,
-        content_type=file.content_type,
-        data=data,
-    )
+    # 表单在这里才解析：先按 Content-Length 拒绝超大请求，避免整段上传落盘后才报错
+    max_size = settings.MAX_UPLOAD_SIZE or 10 * 1024 * 1024
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + _UPLOAD_ENVELOPE_BYTES:
+        raise HTTPException(status_code=413, detail="图片大小超出限制")
+
+    async with request.form(max_files=1, max_fields=1) as form:
+        file = form.get("file")
+        if not isinstance(file, StarletteUploadFile):
+            raise HTTPException(status_code=422, detail="file is required")
+        service = SupportQuickMessageService(db)
+        result = await service.upload_image(operator_id=operator_ctx.operator_id, file=file)
     return Response(message="Image uploaded", data=result)
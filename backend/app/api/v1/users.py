@@ -1,6 +1,7 @@
 """User API routes."""
-from typing import Optional
-from fastapi import APIRouter, Depends, Query, Path, HTTPException
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Query, Path, HTTPException, Request
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.schemas.user import (
@@ -18,12 +19,21 @@ from app.schemas.user import (
 from app.schemas.common import Response
 from app.services.user_service import UserService
 from app.auth import get_operator_context
+from app.utils.http_cache import conditional_json_response
+from app.utils.pagination import PageQuery, PageSizeQuery
+from app.utils.singleflight import SingleFlight
 
-router = APIRouter()
+router = APIRouter(generate_unique_id_function=lambda route: f"users_{route.name}")
+
+_USER_LIST_ADAPTER = TypeAdapter(Response[UserListResponse])
+
+# Concurrent detail requests for the same uid share one DB round-trip
+_user_detail_flight: SingleFlight[UserDetailResponse] = SingleFlight()
 
 
 @router.get("/users", response_model=Response[UserListResponse])
 async def get_users(
+    request: Request,
     uid: Optional[str] = Query(None),
     username: Optional[str] = Query(None),
     displayname: Optional[str] = Query(None),
@@ -31,10 +41,10 @@ async def get_users(
     wallet_address: Optional[str] = Query(None),
     tel: Optional[str] = Query(None),
     status: str = Query("all"),
-    page: int = Query(1, ge=1),
-    page_size: int = Query(10, ge=1, le=100),
+    page: PageQuery = 1,
+    page_size: PageSizeQuery = 10,
     sort_by: str = Query("created_at"),
-    sort_order: str = Query("desc"),
+    sort_order: Literal["asc", "desc"] = Query("desc"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -52,7 +62,8 @@ async def get_users(
     - **sort_by**: Sort field
     - **sort_order**: Sort order (asc/desc)
     """
-    params = UserSearchParams(
+    # 所有约束已在 Query 声明中校验，直接构造跳过二次校验
+    params = UserSearchParams.model_construct(
         user_id=uid,
         username=username,
         display_name=displayname,
@@ -69,7 +80,8 @@ async def get_users(
     user_service = UserService(db)
     result = await user_service.get_users(params)
 
-    return Response(data=result)
+    body = _USER_LIST_ADAPTER.dump_json(Response[UserListResponse](data=result))
+    return conditional_json_response(request, body)
 
 
 @router.get("/users/{uid}", response_model=Response[UserDetailResponse])
@@ -87,15 +99,15 @@ async def get_user_detail(
     - Active ban records
     """
     user_service = UserService(db)
-    user = await user_service.get_user_detail(uid)
+    user = await _user_detail_flight.do(uid, lambda: user_service.get_user_detail(uid))
     return Response(data=user)
 
 
 @router.get("/users/{uid}/ban-history", response_model=Response[BanHistoryListResponse])
 async def get_user_ban_history(
     uid: str = Path(..., description="User ID"),
-    page: int = Query(1, ge=1),
-    size: int = Query(20, ge=1, le=100),
+    page: PageQuery = 1,
+    size: PageSizeQuery = 20,
     db: AsyncSession = Depends(get_db),
 ):
     """Get ban/unban history for a user."""
@@ -2,7 +2,7 @@
 import os
 from typing import List, Optional
 from pydantic_settings import BaseSettings
-from pydantic import Field
+from pydantic import Field, field_validator
 
 
 class Settings(BaseSettings):
@@ -18,10 +18,21 @@ class Settings(BaseSettings):
     DATABASE_URL: str = Field(..., description="PostgreSQL connection URL")
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_RECYCLE: int = 3600
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_WARMUP: int = 10  # connections opened during startup (<= pool size)
+    DATABASE_QUERY_CACHE_SIZE: int = 1200  # SQLAlchemy compiled SQL cache entries
+    DATABASE_PREPARED_STATEMENT_CACHE_SIZE: int = 500  # asyncpg prepared statements per connection
 
     # Redis
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_PASSWORD: str = ""
+    REDIS_SOCKET_TIMEOUT: float = 0.5
+
+    # Response cache (Redis)
+    CACHE_ENABLED: bool = True
+    CACHE_KEY_PREFIX: str = "op-admin"
+    CACHE_DEFAULT_TTL: int = 300
 
     # JWT
     JWT_SECRET_KEY: str = Field(..., min_length=32)
@@ -41,6 +52,7 @@ class Settings(BaseSettings):
     OPENIM_PLATFORM_ID: int = 1
     OPENIM_VERIFY_SSL: bool = True
     OPENIM_ADMIN_TOKEN: Optional[str] = None
+    OPENIM_BATCH_CONCURRENCY: int = 20
 
     # CORS
     CORS_ORIGINS: List[str] = ["http://localhost:3000"]
@@ -106,9 +118,19 @@ class Settings(BaseSettings):
     # Agora UID generation
     AGORA_UID_SALT: Optional[str] = None
 
+    @field_validator("DATABASE_URL")
+    @classmethod
+    def _require_async_driver(cls, value: str) -> str:
+        # A sync driver would block the event loop on every query; fail at startup instead
+        if not value.startswith("postgresql+asyncpg://"):
+            raise ValueError("DATABASE_URL must use the async driver (postgresql+asyncpg://...)")
+        return value
+
     class Config:
         env_file = ".env"
         case_sensitive = True
+        # 进程内只读：模块可以安全地在导入时缓存配置值
+        frozen = True
 
 
 # Create settings instance
@@ -1,5 +1,9 @@
 """Database configuration and session management."""
-from typing import AsyncGenerator
+import asyncio
+from typing import Any, AsyncGenerator, Optional
+
+import orjson
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     create_async_engine,
@@ -8,13 +12,28 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.orm import declarative_base
 from app.config import settings
 
+
+def _json_serializer(value: Any) -> str:
+    # asyncpg's json/jsonb codecs take str; NON_STR_KEYS keeps parity with json.dumps for int keys
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
     pool_pre_ping=True,
+    # LIFO 复用最近归还的连接，使其在服务端保持热态。空闲连接数不会自动收缩：
+    # overflow 连接归还时直接关闭，常驻上限即 pool_size；pool_recycle 只在取出时替换过期连接
+    pool_use_lifo=True,
+    query_cache_size=settings.DATABASE_QUERY_CACHE_SIZE,
+    connect_args={"prepared_statement_cache_size": settings.DATABASE_PREPARED_STATEMENT_CACHE_SIZE},
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -30,25 +49,87 @@ AsyncSessionLocal = async_sessionmaker(
 Base = declarative_base()
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async database session."""
-    async with AsyncSessionLocal() as session:
+def sql_utcnow():
+    """
+    ``now()`` in UTC as a naive timestamp, for column ``default``/``onupdate``.
+
+    Evaluated by PostgreSQL inside the INSERT/UPDATE, so no Python callback runs
+    per row and values stay comparable with the existing naive-UTC columns.
+    Models using it as ``onupdate`` set ``eager_defaults`` so the new value comes
+    back via RETURNING instead of an (async-unsafe) lazy refresh.
+    """
+    return func.timezone("utc", func.now())
+
+
+class SessionManager:
+    """
+    Async context manager owning one session for a unit of work.
+
+    Commits on success, rolls back on error, and always returns the
+    connection to the pool — also when the surrounding task is cancelled
+    (client disconnect), which previously could leak checked-out connections.
+    """
+
+    def __init__(self) -> None:
+        self._session: Optional[AsyncSession] = None
+
+    async def __aenter__(self) -> AsyncSession:
+        self._session = AsyncSessionLocal()
+        return self._session
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        session = self._session
+        self._session = None
+        if exc_type is None:
+            try:
+                await session.commit()
+            except BaseException:
+                await asyncio.shield(self._rollback_and_close(session))
+                raise
+            await asyncio.shield(session.close())
+        else:
+            await asyncio.shield(self._rollback_and_close(session))
+
+    @staticmethod
+    async def _rollback_and_close(session: AsyncSession) -> None:
+        # One shielded coroutine, so a cancellation mid-rollback cannot start
+        # close() on the same session while the rollback is still running
         try:
-            yield session
-            await session.commit()
-        except Exception:
             await session.rollback()
-            raise
         finally:
             await session.close()
 
 
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency for getting async database session."""
+    async with SessionManager() as session:
+        yield session
+
+
 async def init_db() -> None:
     """Initialize database tables."""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_db_pool(size: int) -> None:
+    """Open ``size`` pooled connections up front so the first requests after boot skip the handshake."""
+    if size <= 0:
+        return
+    connections = await asyncio.gather(
+        *(engine.connect() for _ in range(size)),
+        return_exceptions=True,
+    )
+    for conn in connections:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+
+
+def pool_status() -> str:
+    """Human readable pool occupancy (checked in/out, overflow)."""
+    return engine.pool.status()
+
+
 async def close_db() -> None:
     """Close database connections."""
     await engine.dispose()
@@ -1,17 +1,26 @@
 """FastAPI main application."""
-from contextlib import asynccontextmanager
-import json
+import asyncio
+from contextlib import asynccontextmanager, suppress
 import logging
+from functools import lru_cache
 
-from fastapi import FastAPI
+import orjson
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.api.v1 import configuration, operations, support, users
 from app.config import settings
-from app.database import close_db, init_db
+from app.database import close_db, engine, init_db, pool_status, warm_db_pool
+from app.services.audit_service import audit_buffer
+from app.services.cache_service import cache_service
+from app.services.notification_service import notification_service
+from app.services.openim_service import openim_service
+from app.services.user_service import close_external_client
+from app.utils.http_cache import compute_etag, conditional_json_response
 
 # Configure logging
 logging.basicConfig(
@@ -27,12 +36,29 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application...")
     await init_db()
-    logger.info("Database initialized")
+    logger.info("Database initialized (driver: %s)", engine.dialect.driver)
+    await warm_db_pool(min(settings.DATABASE_POOL_WARMUP, settings.DATABASE_POOL_SIZE))
+    logger.info("Database pool warmed: %s", pool_status())
+    await cache_service.connect()
+
+    # Routes are fixed once the app is built: serialize the schema once instead of per request
+    app.state.openapi_body = orjson.dumps(app.openapi())
+    app.state.openapi_etag = compute_etag(app.state.openapi_body)
+
+    app.state.audit_task = asyncio.create_task(audit_buffer.run_forever())
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    app.state.audit_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.audit_task
+    await audit_buffer.flush()
+    await cache_service.close()
+    await openim_service.aclose()
+    await notification_service.aclose()
+    await close_external_client()
     await close_db()
     logger.info("Database connections closed")
 
@@ -42,6 +68,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url=None,
     redoc_url=None,
     openapi_url=None
@@ -59,43 +86,67 @@ app.add_middleware(
 
 
 # Exception handlers
+_INTERNAL_ERROR_BODY = orjson.dumps({"code": 500, "message": "Internal server error", "detail": None})
+_DEBUG = settings.DEBUG
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
     """Global exception handler."""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    if not _DEBUG:
+        return Response(content=_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
+    return ORJSONResponse(
         status_code=500,
         content={
             "code": 500,
             "message": "Internal server error",
-            "detail": str(exc) if settings.DEBUG else None
+            "detail": str(exc),
         }
     )
 
 
-# Health check
-@app.get("/health")
-async def health_check():
-    """Health check endpoint."""
-    return {"status": "healthy", "version": settings.APP_VERSION}
+# Health check: public and unauthenticated, so it reports liveness only. Pool
+# occupancy stays in the logs (see lifespan), never in this response.
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "version": settings.APP_VERSION})
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode("ascii")),
+    ],
+}
 
 
-@app.get("/api/docs", include_in_schema=False)
-async def custom_swagger_ui() -> HTMLResponse:
-    """Swagger UI with default authorization."""
-    swagger_html = get_swagger_ui_html(
-        openapi_url="/api/openapi.json",
-        title=f"{settings.APP_NAME} - API Docs",
-        swagger_ui_parameters={"persistAuthorization": True},
-    )
-    default_token = settings.DOCS_DEFAULT_TOKEN
-    if default_token:
-        swagger_html.set_cookie("swagger_authorization", value=default_token)
-        body = swagger_html.body.decode("utf-8") if swagger_html.body else ""
-        auto_auth_script = f"""
+class HealthCheckMiddleware:
+    """
+    Answer ``GET/HEAD /health`` before the router and the other middleware.
+
+    Load balancers poll this every few seconds on every worker, so the probe
+    skips CORS, route matching and response-model handling entirely. The
+    response is static (no pool or other internals), so it is built once.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != "/health" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        await send(_HEALTH_START)
+        await send({"type": "http.response.body", "body": _HEALTH_BODY if scope["method"] == "GET" else b""})
+
+
+# Added last so it wraps CORS and is the outermost middleware
+app.add_middleware(HealthCheckMiddleware)
+
+
+_SWAGGER_AUTO_AUTH_SCRIPT = """
 <script>
 (function () {{
-    var token = {json.dumps(default_token)};
+    var token = {token};
     window.addEventListener('load', function () {{
         if (token && window.ui) {{
             window.ui.preauthorizeApiKey('BearerAuth', token);
@@ -104,17 +155,40 @@ async def custom_swagger_ui() -> HTMLResponse:
 }})();
 </script>
 """
-        content = body.replace("</body>", f"{auto_auth_script}</body>")
-        new_body = content.encode("utf-8")
-        swagger_html.body = new_body
-        swagger_html.headers["content-length"] = str(len(new_body))
-    return swagger_html
+
+
+@lru_cache(maxsize=1)
+def _swagger_html_body() -> bytes:
+    """Swagger page only depends on settings, so it is rendered once per process."""
+    swagger_html = get_swagger_ui_html(
+        openapi_url="/api/openapi.json",
+        title=f"{settings.APP_NAME} - API Docs",
+        swagger_ui_parameters={"persistAuthorization": True},
+    )
+    body = swagger_html.body or b""
+    if settings.DOCS_DEFAULT_TOKEN:
+        script = _SWAGGER_AUTO_AUTH_SCRIPT.format(token=orjson.dumps(settings.DOCS_DEFAULT_TOKEN).decode("utf-8"))
+        body = body.replace(b"</body>", f"{script}</body>".encode("utf-8"))
+    return body
+
+
+@app.get("/api/docs", include_in_schema=False)
+async def custom_swagger_ui() -> HTMLResponse:
+    """Swagger UI with default authorization."""
+    response = HTMLResponse(content=_swagger_html_body())
+    if settings.DOCS_DEFAULT_TOKEN:
+        response.set_cookie("swagger_authorization", value=settings.DOCS_DEFAULT_TOKEN)
+    return response
 
 
 @app.get("/api/openapi.json", include_in_schema=False)
-async def custom_openapi() -> JSONResponse:
-    """Return OpenAPI schema."""
-    return JSONResponse(app.openapi())
+async def custom_openapi(request: Request) -> Response:
+    """Return the OpenAPI schema serialized at startup."""
+    return conditional_json_response(
+        request,
+        app.state.openapi_body,
+        etag=app.state.openapi_etag,
+    )
 
 
 # Include routers (operations first to register dependencies)
@@ -125,12 +199,18 @@ app.include_router(configuration.router, prefix="/api/v1/configuration", tags=["
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG,
+        # reload 模式只能单进程
+        workers=None if settings.DEBUG else int(os.environ.get("WEB_CONCURRENCY", "1")),
+        loop="uvloop",
+        http="httptools",
+        ws_per_message_deflate=False,
     )
 def custom_openapi_schema():
     if app.openapi_schema:
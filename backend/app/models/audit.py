@@ -1,9 +1,10 @@
 """Audit log model."""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import BigInteger, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import BigInteger, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
-from app.database import Base
+from app.database import Base, sql_utcnow
 
 
 class OperatorAuditLog(Base):
@@ -18,7 +19,7 @@ class OperatorAuditLog(Base):
     action_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     target_type: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     target_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    action_details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    action_details: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     ip_address: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), index=True)
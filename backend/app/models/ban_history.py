@@ -1,9 +1,9 @@
 """Ban history model."""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import String, Integer, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from app.database import Base
+from app.database import Base, sql_utcnow
 
 
 class BanHistory(Base):
@@ -12,11 +12,15 @@ class BanHistory(Base):
     __tablename__ = "ban_his"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False)
     action: Mapped[str] = mapped_column(String(10), nullable=False)  # ban / unban
     reason: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     duration_seconds: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     ban_method: Mapped[Optional[str]] = mapped_column(String(32), nullable=True)
     operator_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     operator_id: Mapped[str] = mapped_column(String, nullable=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), nullable=False, index=True)
+
+
+# Per-user history page: WHERE user_id = ? ORDER BY created_at DESC (also serves plain user_id lookups)
+Index("ix_ban_his_user_id_created_at", BanHistory.user_id, BanHistory.created_at.desc())
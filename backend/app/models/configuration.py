@@ -6,7 +6,7 @@ from sqlalchemy import Boolean, DateTime, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.database import Base
+from app.database import Base, sql_utcnow
 
 
 class StartupMode(Base):
@@ -23,16 +23,17 @@ class AppVersion(Base):
     """Application version release metadata."""
 
     __tablename__ = "app_versions"
+    __mapper_args__ = {"eager_defaults": True}
 
     version: Mapped[str] = mapped_column(String, primary_key=True)
     target_os: Mapped[str] = mapped_column(String, primary_key=True)
     build: Mapped[int] = mapped_column(Integer, primary_key=True)
     force_update: Mapped[bool] = mapped_column(Boolean, primary_key=True, default=False)
 
-    release_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    release_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=sql_utcnow())
     release_notes: Mapped[Optional[str]] = mapped_column(Text)
     download_url: Mapped[Optional[str]] = mapped_column(Text)
     extra: Mapped[Optional[dict]] = mapped_column(JSONB)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
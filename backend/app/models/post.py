@@ -2,7 +2,8 @@
 from datetime import datetime
 from enum import StrEnum
 from typing import Optional, List
-from sqlalchemy import String, Integer, DateTime, ARRAY, Text, Numeric, SmallInteger, DECIMAL, JSON
+from sqlalchemy import String, Integer, DateTime, ARRAY, Text, Numeric, SmallInteger, DECIMAL, Index
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy import ForeignKey
 from app.database import Base
@@ -60,11 +61,11 @@ class Post(Base):
     publish_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     published_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    # Relationships
-    author = relationship("Author", back_populates="posts")
-    image = relationship("Image", back_populates="post", uselist=False)
-    video = relationship("Video", back_populates="post", uselist=False)
-    collection = relationship("Collection", back_populates="post", uselist=False)
+    # Relationships (lazy loads raise under AsyncSession: load them with selectinload/joinedload)
+    author = relationship("Author", back_populates="posts", lazy="raise_on_sql")
+    image = relationship("Image", back_populates="post", uselist=False, lazy="raise_on_sql")
+    video = relationship("Video", back_populates="post", uselist=False, lazy="raise_on_sql")
+    collection = relationship("Collection", back_populates="post", uselist=False, lazy="raise_on_sql")
 
 
 class Image(Base):
@@ -77,10 +78,10 @@ class Image(Base):
     cover: Mapped[Optional[str]] = mapped_column(String(1024))
     width: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     height: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
-    images_data: Mapped[Optional[dict]] = mapped_column(JSON)  # JSONB in DB
+    images_data: Mapped[Optional[dict]] = mapped_column(JSONB)
 
     # Relationships
-    post = relationship("Post", back_populates="image")
+    post = relationship("Post", back_populates="image", lazy="raise_on_sql")
 
 
 class Video(Base):
@@ -95,13 +96,13 @@ class Video(Base):
     url_type: Mapped[Optional[str]] = mapped_column(String)
     processing_status: Mapped[Optional[str]] = mapped_column(String)
     uid: Mapped[Optional[str]] = mapped_column(Text, unique=True)  # Cloudflare UID
-    metainfo: Mapped[Optional[dict]] = mapped_column(JSON)  # JSONB in DB
+    metainfo: Mapped[Optional[dict]] = mapped_column(JSONB)
     width: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     height: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     free_seconds: Mapped[Optional[int]] = mapped_column(Integer, default=0)
 
     # Relationships
-    post = relationship("Post", back_populates="video")
+    post = relationship("Post", back_populates="video", lazy="raise_on_sql")
 
 
 class Collection(Base):
@@ -126,7 +127,7 @@ class Collection(Base):
     contributor_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Relationships
-    post = relationship("Post", back_populates="collection")
+    post = relationship("Post", back_populates="collection", lazy="raise_on_sql")
 
 
 class Pair(Base):
@@ -172,14 +173,42 @@ class Pair(Base):
     bonding_curve: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
 
     # Status (0 = not displayed/pending review, 1 = data ready/approved)
-    status: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0, index=True)
+    # 不单独建 status 索引：ix_pair_status_creator_id / ix_pair_status_created_at 均以 status 开头
+    status: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
 
     # Transaction info
     creation_txid: Mapped[Optional[str]] = mapped_column(Text, index=True)
 
     # Social links
-    social_links: Mapped[Optional[dict]] = mapped_column(JSON, default=dict)  # JSONB in DB
+    social_links: Mapped[Optional[dict]] = mapped_column(JSONB, default=dict)
 
     # Timestamps
     created_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     open_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
+
+    __table_args__ = (
+        # 审核列表：status 过滤 + creator 精确匹配
+        Index("ix_pair_status_creator_id", "status", "creator_id"),
+        # symbol/name 使用 ILIKE '%x%'，需要 trigram 索引
+        Index(
+            "ix_pair_base_symbol_trgm",
+            "base_symbol",
+            postgresql_using="gin",
+            postgresql_ops={"base_symbol": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_pair_base_name_trgm",
+            "base_name",
+            postgresql_using="gin",
+            postgresql_ops={"base_name": "gin_trgm_ops"},
+        ),
+    )
+
+
+# 审核列表按创建时间倒序翻页（表达式索引需在类定义之后声明）
+Index(
+    "ix_pair_status_created_at",
+    Pair.status,
+    Pair.created_at.desc().nulls_last(),
+    Pair.id.desc(),
+)
@@ -1,15 +1,16 @@
 """Post weight model."""
 from datetime import datetime
 from typing import Optional
-from sqlalchemy import String, DateTime, Numeric, Integer
+from sqlalchemy import String, DateTime, Numeric, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column
-from app.database import Base
+from app.database import Base, sql_utcnow
 
 
 class PostWeight(Base):
     """Post weight configuration."""
 
     __tablename__ = "post_weights"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     post_url: Mapped[str] = mapped_column(String(1024), nullable=False)
@@ -17,8 +18,17 @@ class PostWeight(Base):
     weight: Mapped[float] = mapped_column(Numeric(14, 4), nullable=False)
     operator: Mapped[str] = mapped_column(String(255), nullable=False)
     operator_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime, default=sql_utcnow(), onupdate=sql_utcnow(), nullable=False
     )
     deleted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True, index=True)
+
+
+# Active-weight list / count: WHERE deleted_at IS NULL ORDER BY updated_at DESC, id DESC
+Index(
+    "ix_post_weights_active_updated_at_id",
+    PostWeight.updated_at.desc(),
+    PostWeight.id.desc(),
+    postgresql_where=PostWeight.deleted_at.is_(None),
+)
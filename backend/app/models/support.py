@@ -2,15 +2,17 @@
 from datetime import datetime
 import uuid
 from typing import Optional
-from sqlalchemy import Boolean, Integer, String, DateTime, Text, JSON
+from sqlalchemy import Boolean, Index, Integer, String, DateTime, Text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
-from app.database import Base
+from app.database import Base, sql_utcnow
 
 
 class SupportConversation(Base):
     """Customer support conversation."""
 
     __tablename__ = "support_conversations"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
@@ -21,7 +23,7 @@ class SupportConversation(Base):
 
     last_message: Mapped[Optional[str]] = mapped_column(Text)
     last_message_at: Mapped[Optional[datetime]] = mapped_column(DateTime, index=True)
-    messages: Mapped[Optional[list]] = mapped_column(JSON, default=list)
+    messages: Mapped[Optional[list]] = mapped_column(JSONB, default=list)
 
     task_id: Mapped[Optional[str]] = mapped_column(String(128))
     device_type: Mapped[Optional[str]] = mapped_column(String(64))
@@ -31,14 +33,15 @@ class SupportConversation(Base):
     operator_name: Mapped[Optional[str]] = mapped_column(String(128))
     resolved_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
 
 
 class SupportChatStatus(Base):
     """仅记录OpenIM会话的处理状态，不存聊天内容。"""
 
     __tablename__ = "support_chat_statuses"
+    __mapper_args__ = {"eager_defaults": True}
 
     conversation_id: Mapped[str] = mapped_column(String(128), primary_key=True)
     peer_user_id: Mapped[Optional[str]] = mapped_column(String(64), index=True)
@@ -48,14 +51,15 @@ class SupportChatStatus(Base):
     updated_by: Mapped[Optional[str]] = mapped_column(String(64))
     updated_by_name: Mapped[Optional[str]] = mapped_column(String(128))
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
 
 
 class SupportQuickMessage(Base):
     """Support快捷回复模板."""
 
     __tablename__ = "support_quick_messages"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     title: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -70,14 +74,15 @@ class SupportQuickMessage(Base):
     updated_by: Mapped[Optional[str]] = mapped_column(String(64))
     updated_by_name: Mapped[Optional[str]] = mapped_column(String(128))
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
 
 
 class SupportCase(Base):
     """客服工单/Case."""
 
     __tablename__ = "support_cases"
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     support_id: Mapped[str] = mapped_column(String(64), nullable=False, unique=True, index=True)
@@ -86,5 +91,9 @@ class SupportCase(Base):
     comment: Mapped[Optional[str]] = mapped_column(Text)
     status: Mapped[str] = mapped_column(String(32), nullable=False, default="open", index=True)
 
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=sql_utcnow(), onupdate=sql_utcnow())
+
+
+# Keyset pagination for list_cases: ORDER BY created_at DESC, id DESC
+Index("ix_support_cases_created_at_id", SupportCase.created_at.desc(), SupportCase.id.desc())
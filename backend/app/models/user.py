@@ -1,7 +1,7 @@
 """User related models - matching existing database schema."""
 from datetime import datetime
 from typing import Optional, List
-from sqlalchemy import String, Boolean, DateTime, ARRAY, Date, Integer, ForeignKey, Text
+from sqlalchemy import String, Boolean, DateTime, ARRAY, Date, Integer, ForeignKey, Index, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.database import Base
 
@@ -32,10 +32,10 @@ class User(Base):
     created_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
-    # Relationships
-    author = relationship("Author", back_populates="user", uselist=False)
-    wallets = relationship("UserWallet", back_populates="user")
-    bans = relationship("Ban", foreign_keys="Ban.user_id", back_populates="user")
+    # Relationships (lazy loads raise under AsyncSession: load them with selectinload/joinedload)
+    author = relationship("Author", back_populates="user", uselist=False, lazy="raise_on_sql")
+    wallets = relationship("UserWallet", back_populates="user", lazy="raise_on_sql")
+    bans = relationship("Ban", foreign_keys="Ban.user_id", back_populates="user", lazy="raise_on_sql")
 
 
 class Author(Base):
@@ -74,8 +74,8 @@ class Author(Base):
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Relationships
-    user = relationship("User", back_populates="author")
-    posts = relationship("Post", back_populates="author")
+    user = relationship("User", back_populates="author", lazy="raise_on_sql")
+    posts = relationship("Post", back_populates="author", lazy="raise_on_sql")
 
 
 class UserWallet(Base):
@@ -92,7 +92,7 @@ class UserWallet(Base):
     updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
     # Relationships
-    user = relationship("User", back_populates="wallets")
+    user = relationship("User", back_populates="wallets", lazy="raise_on_sql")
 
 
 class Ban(Base):
@@ -110,4 +110,39 @@ class Ban(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
 
     # Relationships
-    user = relationship("User", foreign_keys=[user_id], back_populates="bans")
+    user = relationship("User", foreign_keys=[user_id], back_populates="bans", lazy="raise_on_sql")
+
+
+# 用户列表的作者名/昵称搜索使用 ILIKE '%x%'，需要 trigram 索引
+Index(
+    "ix_authors_username_trgm",
+    Author.username,
+    postgresql_using="gin",
+    postgresql_ops={"username": "gin_trgm_ops"},
+)
+Index(
+    "ix_authors_name_trgm",
+    Author.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+)
+# 钱包地址模糊搜索
+Index(
+    "ix_user_wallet_pubkey_trgm",
+    UserWallet.pubkey,
+    postgresql_using="gin",
+    postgresql_ops={"pubkey": "gin_trgm_ops"},
+)
+# 客服资料取每个用户最新钱包：DISTINCT ON (user_id) ORDER BY user_id, created_at DESC
+Index(
+    "ix_user_wallet_user_id_created_at",
+    UserWallet.user_id,
+    UserWallet.created_at.desc().nulls_last(),
+)
+# 封禁前检查是否已有生效中的封禁：WHERE user_id = ? AND revoked_at IS NULL
+Index(
+    "ix_bans_user_id_unrevoked",
+    Ban.user_id,
+    Ban.ends_at,
+    postgresql_where=Ban.revoked_at.is_(None),
+)
@@ -1,12 +1,14 @@
 """Common response schemas."""
 from typing import Any, Optional, Generic, TypeVar
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 T = TypeVar('T')
 
 
 class Response(BaseModel, Generic[T]):
     """Standard API response."""
+    model_config = ConfigDict(from_attributes=True)
+
     code: int = 0
     message: str = "success"
     data: Optional[T] = None
@@ -16,6 +16,7 @@ class StartupModeItem(BaseModel):
 
 class StartupModeListResponse(BaseModel):
     items: list[StartupModeItem]
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, null on the last page")
 
 
 class StartupModeUpdateItem(BaseModel):
@@ -1,7 +1,7 @@
 """Meme审核相关schema（保留旧字段名以兼容前端，数据源已改为DB）。"""
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field
 
 
 # Kafka Meme Creation Message Schema
@@ -27,8 +27,8 @@ class MemeCreationMessage(BaseModel):
     _kafka_partition: Optional[int] = None
     _kafka_timestamp: Optional[int] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "user_id": "BhnjgBmPBDZ",
                 "collection_id": "BhwIj-XgpmH",
@@ -46,6 +46,7 @@ class MemeCreationMessage(BaseModel):
                 "holdview_amount": "0"
             }
         }
+    )
 
 
 class MemeReviewListItem(BaseModel):
@@ -69,8 +70,7 @@ class MemeReviewListItem(BaseModel):
     creator_username: Optional[str] = None
     creator_name: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class MemeReviewListResponse(BaseModel):
@@ -83,16 +83,17 @@ class MemeReviewListResponse(BaseModel):
 
 class MemeReviewRequest(BaseModel):
     """Request to review a meme."""
-    action: str = Field(..., pattern="^(approve|reject)$")
+    action: Literal["approve", "reject"]
     comment: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "action": "approve",
                 "comment": "Token verified, looks good"
             }
         }
+    )
 
 
 class MemeSearchParams(BaseModel):
@@ -110,8 +111,8 @@ class MemeMockLoadRequest(BaseModel):
     """Request body for loading mock meme messages (testing only)."""
     memes: List[MemeCreationMessage]
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "memes": [
                     {
@@ -133,6 +134,7 @@ class MemeMockLoadRequest(BaseModel):
                 ]
             }
         }
+    )
 
 
 # Keep old Pair-related schemas for direct DB queries if needed
@@ -149,8 +151,7 @@ class PairResponse(BaseModel):
     status: int
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PairListResponse(BaseModel):
@@ -1,17 +1,26 @@
 """Post weight schemas."""
 from datetime import datetime
-from decimal import Decimal
 from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class PostWeightCreateRequest(BaseModel):
     """创建或更新帖子权重的请求体."""
 
-    post_urls: str = Field(..., description="多个postURL，使用逗号分隔")
+    post_urls: List[str] = Field(..., description="postURL列表，兼容逗号分隔的字符串")
     weight: float = Field(..., description="权重值", ge=0)
     operator: Optional[str] = Field(None, description="操作人标识，默认使用当前登录用户")
 
+    @field_validator("post_urls", mode="before")
+    @classmethod
+    def split_post_urls(cls, value):
+        if isinstance(value, str):
+            value = value.split(",")
+        if isinstance(value, list):
+            value = [url.strip() if isinstance(url, str) else url for url in value]
+            return [url for url in value if url != ""]
+        return value
+
 
 class PostWeightCancelRequest(BaseModel):
     """批量取消帖子权重的请求体."""
@@ -31,7 +40,7 @@ class PostWeightResponse(BaseModel):
     id: int
     post_url: str
     post_id: str
-    weight: float
+    weight: float  # Numeric 列返回的 Decimal 由 pydantic-core 直接转换为 float
     operator: str
     operator_id: Optional[str] = Field(
         default=None, description="操作人ID，兼容旧字段operator"
@@ -40,23 +49,28 @@ class PostWeightResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("weight", mode="before")
-    @classmethod
-    def convert_decimal(cls, value):
-        if isinstance(value, Decimal):
-            return float(value)
-        return value
+    model_config = ConfigDict(from_attributes=True)
 
-    @model_validator(mode="after")
-    def fill_operator_name(self):
-        if self.operator_name is None:
-            object.__setattr__(self, "operator_name", self.operator)
-        if self.operator_id is None:
-            object.__setattr__(self, "operator_id", self.operator)
-        return self
-
-    class Config:
-        from_attributes = True
+    @classmethod
+    def from_record(cls, record) -> "PostWeightResponse":
+        """
+        Build from a ``PostWeight`` row.
+
+        Columns are already typed by the ORM, so skip validation; operator_id /
+        operator_name fall back to the legacy ``operator`` field here instead of
+        in a per-instance validator.
+        """
+        return cls.model_construct(
+            id=record.id,
+            post_url=record.post_url,
+            post_id=record.post_id,
+            weight=float(record.weight),
+            operator=record.operator,
+            operator_id=record.operator,
+            operator_name=record.operator_name or record.operator,
+            created_at=record.created_at,
+            updated_at=record.updated_at,
+        )
 
 
 class PostWeightListResponse(BaseModel):
@@ -66,3 +80,4 @@ class PostWeightListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(default=None, description="下一页游标，最后一页为空")
@@ -104,7 +104,7 @@ class SupporterListResponse(BaseModel):
 
 class SupportImLookupRequest(BaseModel):
     """批量IM ID查询请求."""
-    im_ids: List[str] = Field(..., min_items=1, description="OpenIM im_id 列表")
+    im_ids: List[str] = Field(..., min_length=1, max_length=1000, description="OpenIM im_id 列表（最多1000个）")
 
 
 class SupportImLookupItem(BaseModel):
@@ -157,6 +157,7 @@ class SupportCaseListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = Field(default=None, description="下一页游标，最后一页为空")
 
 
 # ------------------------------- 快捷消息 ------------------------------- #
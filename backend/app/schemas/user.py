@@ -1,7 +1,7 @@
 """User schemas - matching actual database structure."""
 from datetime import datetime, date
 from typing import Optional, List, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 # User schemas
@@ -32,8 +32,7 @@ class UserResponse(UserBase):
     created_at: Optional[datetime] = None
     is_superuser: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Author schemas
@@ -55,8 +54,7 @@ class AuthorResponse(AuthorBase):
     region: str
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Wallet schemas
@@ -67,8 +65,7 @@ class WalletResponse(BaseModel):
     status: str
     created_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Combined user detail response
@@ -91,8 +88,8 @@ class BanRequest(BaseModel):
     notify: bool = Field(default=False, description="Send notification")
     notify_message: Optional[str] = None
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reason": "test",
                 "duration": 180,
@@ -101,6 +98,7 @@ class BanRequest(BaseModel):
                 "ban_method": "account"
             }
         }
+    )
 
 
 class UnbanRequest(BaseModel):
@@ -119,8 +117,7 @@ class BanResponse(BaseModel):
     created_at: datetime
     is_active: bool = Field(default=True)  # Computed field
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # Search/Filter schemas
@@ -142,10 +139,9 @@ class UserSearchParams(BaseModel):
     page: int = Field(default=1, ge=1)
     page_size: int = Field(default=10, ge=1, le=100)
     sort_by: str = Field(default="created_at")
-    sort_order: str = Field(default="desc", pattern="^(asc|desc)$")
+    sort_order: Literal["asc", "desc"] = "desc"
 
-    class Config:
-        extra = "ignore"
+    model_config = ConfigDict(extra="ignore")
 
 
 class UserListResponse(BaseModel):
@@ -162,8 +158,7 @@ class UserUpdate(BaseModel):
     region: Optional[str] = None
     preferred_languages: Optional[List[str]] = None
 
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid")
 
 
 class BanUserRequest(BanRequest):
@@ -201,8 +196,7 @@ class BanHistoryItem(BaseModel):
     created_at: datetime
     ban_method: Optional[str] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class BanHistoryListResponse(BaseModel):
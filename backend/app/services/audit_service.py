@@ -1,12 +1,95 @@
 """Audit service for logging operator actions."""
+import asyncio
 from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import SessionManager
 from app.models.audit import OperatorAuditLog
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+class AuditBuffer:
+    """
+    In-process queue that writes audit rows in batches.
+
+    Request handlers only enqueue; a background task started from the app
+    lifespan drains the queue into one executemany INSERT per batch (up to
+    ``BATCH_SIZE`` rows or ``FLUSH_INTERVAL`` seconds), on its own session.
+    """
+
+    BATCH_SIZE = 500
+    FLUSH_INTERVAL = 0.2
+    MAX_QUEUED = 10_000
+    RETRY_DELAY = 1.0
+    MAX_RETRY_DELAY = 30.0
+    FLUSH_ATTEMPTS = 3
+
+    def __init__(self):
+        self._queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue(maxsize=self.MAX_QUEUED)
+        # Rows taken off the queue but not yet written; kept across failed writes and for shutdown
+        self._batch: List[Dict[str, Any]] = []
+
+    def put(self, row: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.error("Audit buffer full, dropping entry: %s", row)
+
+    async def run_forever(self) -> None:
+        """Drain loop; cancel the task to stop, then call ``flush``."""
+        loop = asyncio.get_running_loop()
+        retry_delay = self.RETRY_DELAY
+        while True:
+            if not self._batch:
+                self._batch.append(await self._queue.get())
+            deadline = loop.time() + self.FLUSH_INTERVAL
+            while len(self._batch) < self.BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            if await self._write_batch():
+                retry_delay = self.RETRY_DELAY
+            else:
+                # 写入失败时保留本批，退避后连同新入队的行一起重试
+                await asyncio.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, self.MAX_RETRY_DELAY)
+
+    async def flush(self) -> None:
+        """Write everything still buffered (used on shutdown)."""
+        while not self._queue.empty():
+            self._batch.append(self._queue.get_nowait())
+        for attempt in range(1, self.FLUSH_ATTEMPTS + 1):
+            if not self._batch or await self._write_batch():
+                return
+            if attempt < self.FLUSH_ATTEMPTS:
+                await asyncio.sleep(self.RETRY_DELAY)
+        logger.error(
+            "Dropping %s audit logs after %s failed flush attempts",
+            len(self._batch), self.FLUSH_ATTEMPTS,
+        )
+        self._batch = []
+
+    async def _write_batch(self) -> bool:
+        """Insert the pending batch; on failure it is kept for the next attempt."""
+        rows = self._batch
+        try:
+            async with SessionManager() as session:
+                await session.execute(insert(OperatorAuditLog), rows)
+        except Exception as e:
+            logger.error(f"Error writing {len(rows)} audit logs, will retry: {e}")
+            return False
+        logger.info("Audit logs written: %s", len(rows))
+        self._batch = []
+        return True
+
+
 class AuditService:
     """Audit service for logging operator actions."""
 
@@ -26,6 +109,9 @@ class AuditService:
         """
         Log operator action.
 
+        The entry is queued on ``audit_buffer`` and written in the background,
+        so the request neither waits for nor shares a transaction with it.
+
         Args:
             operator_id: ID of the operator performing the action
             action_type: Type of action (ban_user, approve_meme, etc.)
@@ -39,25 +125,26 @@ class AuditService:
             if not operator_id:
                 raise ValueError("operator_id is required for audit logging")
 
-            audit_log = OperatorAuditLog(
-                operator_id=str(operator_id),
-                action_type=action_type,
-                target_type=target_type,
-                target_id=str(target_id) if target_id is not None else None,
-                action_details=action_details,
-                ip_address=ip_address,
-                user_agent=user_agent,
-                created_at=datetime.utcnow()
-            )
-
-            self.db.add(audit_log)
-            await self.db.commit()
+            audit_buffer.put({
+                "operator_id": str(operator_id),
+                "action_type": action_type,
+                "target_type": target_type,
+                "target_id": str(target_id) if target_id is not None else None,
+                "action_details": action_details,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "created_at": datetime.utcnow(),
+            })
 
             logger.info(
-                f"Audit log created: operator={operator_id}, "
+                f"Audit log queued: operator={operator_id}, "
                 f"action={action_type}, target={target_type}:{target_id}"
             )
 
         except Exception as e:
             logger.error(f"Error creating audit log: {e}")
             # Don't raise exception to avoid breaking the main flow
+
+
+# Global instance
+audit_buffer = AuditBuffer()
@@ -0,0 +1,94 @@
+"""Redis backed response cache."""
+import logging
+from typing import Optional, Union
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheService:
+    """
+    Thin wrapper around Redis used to cache read-mostly API payloads.
+
+    Cache failures never propagate: a Redis outage degrades to a cache miss so
+    requests fall through to PostgreSQL.
+    """
+
+    def __init__(self):
+        self.prefix = settings.CACHE_KEY_PREFIX
+        self._client: Optional[Redis] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._client is not None
+
+    async def connect(self) -> None:
+        """Create the Redis client (connections are opened lazily)."""
+        if not settings.CACHE_ENABLED or self._client is not None:
+            return
+        self._client = Redis.from_url(
+            settings.REDIS_URL,
+            password=settings.REDIS_PASSWORD or None,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+        logger.info("Redis cache enabled (%s)", settings.REDIS_URL)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def key(self, namespace: str, *parts: object) -> str:
+        """Build a cache key under ``<prefix>:<namespace>``."""
+        return ":".join([self.prefix, namespace, *(str(part) for part in parts)])
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if self._client is None:
+            return None
+        try:
+            return await self._client.get(key)
+        except RedisError as exc:
+            logger.warning("Cache get failed for %s: %s", key, exc)
+            return None
+
+    async def set(self, key: str, value: Union[bytes, str], expire: Optional[int] = None) -> None:
+        if self._client is None:
+            return
+        try:
+            await self._client.set(key, value, ex=expire or settings.CACHE_DEFAULT_TTL)
+        except RedisError as exc:
+            logger.warning("Cache set failed for %s: %s", key, exc)
+
+    async def delete(self, *keys: str) -> None:
+        if self._client is None or not keys:
+            return
+        try:
+            await self._client.delete(*keys)
+        except RedisError as exc:
+            logger.warning("Cache delete failed for %s: %s", keys, exc)
+
+    async def clear_namespace(self, namespace: str) -> None:
+        """Drop every key stored under ``namespace``."""
+        if self._client is None:
+            return
+        pattern = f"{self.prefix}:{namespace}:*"
+        try:
+            batch = []
+            async for key in self._client.scan_iter(match=pattern, count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._client.delete(*batch)
+                    batch = []
+            if batch:
+                await self._client.delete(*batch)
+        except RedisError as exc:
+            logger.warning("Cache clear failed for %s: %s", namespace, exc)
+
+
+# Global instance
+cache_service = CacheService()
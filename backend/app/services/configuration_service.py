@@ -7,7 +7,8 @@ import logging
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import func, select, delete
+from sqlalchemy import and_, func, or_, select, delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -27,9 +28,14 @@ from app.schemas.configuration import (
     StartupModeUpdateItem,
 )
 from app.services.audit_service import AuditService
+from app.services.cache_service import cache_service
+from app.utils.pagination import decode_cursor, encode_cursor
 
 logger = logging.getLogger(__name__)
 
+STARTUP_MODES_CACHE_NS = "startup-modes"
+APP_VERSIONS_CACHE_NS = "app-versions"
+
 
 class ConfigurationService:
     """Service layer for configuration management."""
@@ -45,20 +51,61 @@ class ConfigurationService:
         os_filter: Optional[str] = None,
         limit: int = 10,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> StartupModeListResponse:
+        """List startup modes ordered by (os asc, build desc, mode asc).
+
+        When ``cursor`` is given the page is fetched with a keyset predicate on
+        the primary key instead of ``OFFSET``; ``offset`` is kept for old clients.
+        """
+        cache_key = cache_service.key(
+            STARTUP_MODES_CACHE_NS, mode or "", os_filter or "", limit, offset, cursor or ""
+        )
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return StartupModeListResponse.model_validate_json(cached)
+
         stmt = select(StartupMode)
         if mode:
             stmt = stmt.where(StartupMode.mode == mode)
         if os_filter:
             stmt = stmt.where(StartupMode.os == os_filter)
 
+        if cursor:
+            c_os, c_build, c_mode = decode_cursor(cursor, 3)
+            # startup_modes 主键三列均为 String（build 也是字符串）
+            if not all(isinstance(value, str) for value in (c_os, c_build, c_mode)):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(
+                or_(
+                    StartupMode.os > c_os,
+                    and_(StartupMode.os == c_os, StartupMode.build < c_build),
+                    and_(
+                        StartupMode.os == c_os,
+                        StartupMode.build == c_build,
+                        StartupMode.mode > c_mode,
+                    ),
+                )
+            )
+
         stmt = stmt.order_by(StartupMode.os.asc(), StartupMode.build.desc(), StartupMode.mode.asc())
-        stmt = stmt.limit(limit).offset(offset)
+        stmt = stmt.limit(limit + 1)
+        if offset and not cursor:
+            stmt = stmt.offset(offset)
 
         result = await self.db.execute(stmt)
-        rows = result.scalars().all()
+        rows = list(result.scalars().all())
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor((last.os, last.build, last.mode))
+
         items = [StartupModeItem.model_validate(row) for row in rows]
-        return StartupModeListResponse(items=items)
+        response = StartupModeListResponse(items=items, next_cursor=next_cursor)
+        await cache_service.set(cache_key, response.model_dump_json())
+        return response
 
     # ------------------------------------------------------------------ #
     async def add_startup_modes(
@@ -70,23 +117,17 @@ class ConfigurationService:
         if not payload.items:
             raise HTTPException(status_code=400, detail="No startup mode entries provided")
 
-        for item in payload.items:
-            stmt = select(StartupMode).where(
-                StartupMode.os == item.os,
-                StartupMode.build == item.build,
-                StartupMode.mode == item.mode,
-            )
-            existing = await self.db.scalar(stmt)
-            if existing:
-                # 替换式新增：先删除旧记录，再插入新记录
-                await self.db.delete(existing)
-                await self.db.flush()
-
-        for item in payload.items:
-            record = StartupMode(os=item.os, build=item.build, mode=item.mode)
-            self.db.add(record)
+        # (os, build, mode) 即主键且无其他列：已存在的行与新行完全一致，
+        # 一条多行 INSERT ... ON CONFLICT DO NOTHING 即可替代逐条查询/删除/插入
+        rows = list({(item.os, item.build, item.mode): None for item in payload.items})
+        await self.db.execute(
+            pg_insert(StartupMode)
+            .values([{"os": os_, "build": build, "mode": mode} for os_, build, mode in rows])
+            .on_conflict_do_nothing()
+        )
 
         await self.db.commit()
+        await cache_service.clear_namespace(STARTUP_MODES_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -127,6 +168,7 @@ class ConfigurationService:
 
         # 自动识别删除版本：找出此前为 strict 但本次未传入的版本，推 normal
         # （本地不再存储，无法对比历史，这里依赖前端显式传入删除列表）
+        await cache_service.clear_namespace(STARTUP_MODES_CACHE_NS)
 
         # 不写库，直接回传本次请求的内容
         return StartupModeListResponse(items=[StartupModeItem(os=item.os, build=item.build, mode=item.mode) for item in items])
@@ -208,6 +250,12 @@ class ConfigurationService:
         page: int = 1,
         page_size: int = 10,
     ) -> AppVersionConfigResponse:
+        # 聚合结果与分页参数无关，使用固定 key
+        cache_key = cache_service.key(APP_VERSIONS_CACHE_NS, "latest")
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return AppVersionConfigResponse.model_validate_json(cached)
+
         row_number = func.row_number().over(
             partition_by=(AppVersion.target_os, AppVersion.force_update),
             order_by=[
@@ -244,12 +292,14 @@ class ConfigurationService:
             if slot == "mandatory" and mandatory_prompt is None:
                 mandatory_prompt = version_obj.release_notes
 
-        return AppVersionConfigResponse(
+        response = AppVersionConfigResponse(
             ios=platforms.get("ios", PlatformVersionInfo()),
             android=platforms.get("android", PlatformVersionInfo()),
             optional_prompt=optional_prompt,
             mandatory_prompt=mandatory_prompt,
         )
+        await cache_service.set(cache_key, response.model_dump_json())
+        return response
 
     # ------------------------------------------------------------------ #
     async def update_app_versions(
@@ -268,6 +318,7 @@ class ConfigurationService:
         # 直接调用外部接口，不再写本地表
         for entry in entries:
             await self._call_external_update_version(entry)
+        await cache_service.clear_namespace(APP_VERSIONS_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -346,6 +397,7 @@ class ConfigurationService:
                 detail=f"外部版本更新接口返回异常状态: {response.status_code}",
             )
 
+        await cache_service.clear_namespace(APP_VERSIONS_CACHE_NS)
         return {
             "status_code": response.status_code,
             "response": data,
@@ -418,6 +470,7 @@ class ConfigurationService:
                 detail=f"External mode API returned status: {response.status_code}",
             )
 
+        await cache_service.clear_namespace(STARTUP_MODES_CACHE_NS)
         return {
             "status_code": response.status_code,
             "response": data,
@@ -1,9 +1,11 @@
 """Kafka service for consuming and producing Meme creation events."""
+import contextlib
 import json
 import logging
 from typing import Optional, Dict, Any, List
 from aiokafka import AIOKafkaConsumer, AIOKafkaProducer
 from aiokafka.errors import KafkaError
+import orjson
 from app.config import settings
 
 logger = logging.getLogger(__name__)
@@ -20,20 +22,24 @@ class KafkaService:
 
     async def start_consumer(self):
         """Start Kafka consumer for meme creation topic."""
+        consumer = AIOKafkaConsumer(
+            settings.KAFKA_MEME_CREATION_TOPIC,
+            bootstrap_servers=self.bootstrap_servers,
+            group_id=settings.KAFKA_CONSUMER_GROUP,
+            auto_offset_reset=settings.KAFKA_AUTO_OFFSET_RESET,
+            enable_auto_commit=False,  # Manual commit after processing
+            value_deserializer=orjson.loads,
+        )
         try:
-            self.consumer = AIOKafkaConsumer(
-                settings.KAFKA_MEME_CREATION_TOPIC,
-                bootstrap_servers=self.bootstrap_servers,
-                group_id=settings.KAFKA_CONSUMER_GROUP,
-                auto_offset_reset=settings.KAFKA_AUTO_OFFSET_RESET,
-                enable_auto_commit=False,  # Manual commit after processing
-                value_deserializer=lambda m: json.loads(m.decode('utf-8'))
-            )
-            await self.consumer.start()
-            logger.info(f"Kafka consumer started for topic: {settings.KAFKA_MEME_CREATION_TOPIC}")
+            await consumer.start()
         except Exception as e:
             logger.error(f"Failed to start Kafka consumer: {e}")
+            # Release whatever start() managed to open; self.consumer stays unset so callers retry
+            with contextlib.suppress(Exception):
+                await consumer.stop()
             raise
+        self.consumer = consumer
+        logger.info(f"Kafka consumer started for topic: {settings.KAFKA_MEME_CREATION_TOPIC}")
 
     async def start_producer(self):
         """Start Kafka producer for approved memes."""
@@ -50,8 +56,9 @@ class KafkaService:
 
     async def stop_consumer(self):
         """Stop Kafka consumer."""
-        if self.consumer:
-            await self.consumer.stop()
+        consumer, self.consumer = self.consumer, None
+        if consumer:
+            await consumer.stop()
             logger.info("Kafka consumer stopped")
 
     async def stop_producer(self):
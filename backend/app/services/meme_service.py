@@ -1,7 +1,7 @@
 """Meme service - now reading pending items from database tables."""
 from datetime import datetime
 import json
-from sqlalchemy import func, select, delete
+from sqlalchemy import delete, func, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from app.models.user import Author
@@ -58,7 +58,7 @@ class MemeService:
         filters = self._build_filters(params)
 
         base_query = (
-            select(Pair, Post, Collection, Author)
+            select(Pair.id)
             .join(Post, Pair.collection_id == Post.id, isouter=True)
             .join(Collection, Collection.id == Post.id, isouter=True)
             .join(
@@ -77,7 +77,28 @@ class MemeService:
         total = await self.db.scalar(count_stmt) or 0
 
         data_stmt = (
-            base_query
+            # 只取列表用到的列，按行元组读取，不经过 ORM 实例化与 identity map；
+            # pair 的 Numeric(78, 0) 金额/市值列每行都会生成 Decimal，列表并不需要
+            base_query.with_only_columns(
+                Pair.id,
+                Pair.chain,
+                Pair.creator_id,
+                Pair.collection_id,
+                Pair.base_name,
+                Pair.base_symbol,
+                Pair.base_image_url,
+                Pair.base_description,
+                Pair.social_links,
+                Pair.created_at,
+                Pair.base_created_at,
+                Post.id.label("post_id"),
+                Post.created_at.label("post_created_at"),
+                Post.region,
+                Post.holdview_amount,
+                Collection.cover,
+                Author.username.label("creator_username"),
+                Author.name.label("creator_name"),
+            )
             .order_by(Pair.created_at.desc().nulls_last(), Pair.id.desc())
             .offset(offset)
             .limit(params.page_size)
@@ -86,29 +107,31 @@ class MemeService:
         rows = result.all()
 
         items = []
-        for pair, post, collection, creator in rows:
-            created_at = pair.created_at or pair.base_created_at or (post.created_at if post else None)
-            avatar = pair.base_image_url or (collection.cover if collection else None) or ""
-            social_links = self._normalize_social_links(pair.social_links)
-            item = MemeReviewListItem(
-                order_id=str(pair.id),
-                user_id=pair.creator_id or "",
-                collection_id=pair.collection_id or (post.id if post else ""),
-                name=pair.base_name or "",
-                symbol=pair.base_symbol or "",
+        for row in rows:
+            has_post = row.post_id is not None
+            created_at = row.created_at or row.base_created_at or row.post_created_at
+            avatar = row.base_image_url or row.cover or ""
+            social_links = self._normalize_social_links(row.social_links)
+            # 字段均已按列类型取出并归一化，逐行构造时跳过校验
+            item = MemeReviewListItem.model_construct(
+                order_id=str(row.id),
+                user_id=row.creator_id or "",
+                collection_id=row.collection_id or (row.post_id if has_post else ""),
+                name=row.base_name or "",
+                symbol=row.base_symbol or "",
                 avatar=avatar,
-                about=pair.base_description or "",
-                chain_id=pair.chain,
+                about=row.base_description or "",
+                chain_id=row.chain,
                 social_links=social_links,
-                user_region=post.region if post and post.region else "US",
-                holdview_amount=post.holdview_amount if post else None,
+                user_region=row.region or "US",
+                holdview_amount=row.holdview_amount if has_post else None,
                 kafka_timestamp=created_at,
-                creator_username=creator.username if creator else None,
-                creator_name=creator.name if creator else None,
+                creator_username=row.creator_username,
+                creator_name=row.creator_name,
             )
             items.append(item)
 
-        return MemeReviewListResponse(
+        return MemeReviewListResponse.model_construct(
             items=items,
             total=total,
             page=params.page,
@@ -124,8 +147,9 @@ class MemeService:
         except (TypeError, ValueError):
             raise HTTPException(status_code=404, detail="Meme not found in review queue")
 
-        stmt = (
-            select(Pair, Post, Collection)
+        # 固定结构的宽表查询：lambda_stmt 按代码位置缓存构造结果，每次只重新绑定 pair_id
+        stmt = lambda_stmt(
+            lambda: select(Pair, Post, Collection)
             .join(Post, Pair.collection_id == Post.id, isouter=True)
             .join(Collection, Collection.id == Post.id, isouter=True)
             .where(Pair.id == pair_id)
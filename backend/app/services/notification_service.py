@@ -13,6 +13,21 @@ class NotificationService:
     def __init__(self):
         self.api_url = settings.NOTIFICATION_API_URL
         self.timeout = 10.0
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client so notifications reuse pooled keep-alive connections."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def send_notification(
         self,
@@ -47,34 +62,34 @@ class NotificationService:
         endpoint = f"{self.api_url}?role=write"
 
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
+            client = self._get_client()
+            response = await client.post(
+                endpoint,
+                headers={
+                    "accept": "application/json",
+                    "Content-Type": "application/json"
+                },
+                json=payload,
+                timeout=self.timeout
+            )
+
+            if response.status_code == 200:
+                logger.info(
+                    "Notification sent successfully status=%s endpoint=%s payload=%s",
+                    response.status_code,
                     endpoint,
-                    headers={
-                        "accept": "application/json",
-                        "Content-Type": "application/json"
-                    },
-                    json=payload,
-                    timeout=self.timeout
+                    payload,
                 )
-
-                if response.status_code == 200:
-                    logger.info(
-                        "Notification sent successfully status=%s endpoint=%s payload=%s",
-                        response.status_code,
-                        endpoint,
-                        payload,
-                    )
-                    return True
-                else:
-                    logger.error(
-                        "Failed to send notification status=%s endpoint=%s payload=%s response=%s",
-                        response.status_code,
-                        endpoint,
-                        payload,
-                        response.text[:500],
-                    )
-                    return False
+                return True
+            else:
+                logger.error(
+                    "Failed to send notification status=%s endpoint=%s payload=%s response=%s",
+                    response.status_code,
+                    endpoint,
+                    payload,
+                    response.text[:500],
+                )
+                return False
 
         except httpx.TimeoutException:
             logger.error(
@@ -1,4 +1,5 @@
 """OpenIM integration service for chat functionality."""
+import asyncio
 import httpx
 import logging
 import time
@@ -19,6 +20,23 @@ class OpenIMService:
         self.admin_user_id = settings.OPENIM_ADMIN_USER_ID
         self.platform_id = settings.OPENIM_PLATFORM_ID
         self.verify_ssl = getattr(settings, "OPENIM_VERIFY_SSL", True)
+        self.batch_concurrency = settings.OPENIM_BATCH_CONCURRENCY
+        self._client: Optional[httpx.AsyncClient] = None
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Shared client so calls reuse pooled keep-alive connections."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                verify=self.verify_ssl,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
     async def get_token(self, user_id: str = None) -> Optional[str]:
         """
@@ -36,46 +54,46 @@ class OpenIMService:
 
         target_user = user_id or self.admin_user_id
         try:
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/auth/user_token",
-                    headers={
-                        "operationID": str(int(time.time() * 1000)),
-                    },
-                    json={
-                        "secret": self.secret,
-                        "platform_id": self.platform_id,
-                        "user_id": target_user,
-                    },
-                    timeout=10.0,
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/auth/user_token",
+                headers={
+                    "operationID": str(int(time.time() * 1000)),
+                },
+                json={
+                    "secret": self.secret,
+                    "platform_id": self.platform_id,
+                    "user_id": target_user,
+                },
+                timeout=10.0,
+            )
+            if response.status_code != 200:
+                logger.error(
+                    "Failed to get token (HTTP): status=%s verify_ssl=%s url=%s admin=%s body=%s",
+                    response.status_code,
+                    self.verify_ssl,
+                    self.api_url,
+                    target_user,
+                    response.text,
                 )
-                if response.status_code != 200:
-                    logger.error(
-                        "Failed to get token (HTTP): status=%s verify_ssl=%s url=%s admin=%s body=%s",
-                        response.status_code,
-                        self.verify_ssl,
-                        self.api_url,
-                        target_user,
-                        response.text,
-                    )
-                    return None
+                return None
 
-                data = response.json()
-                err_code = data.get("errCode")
-                if err_code not in (0, None):
-                    logger.error(
-                        "Failed to get token (OpenIM errCode): errCode=%s errMsg=%s errDlt=%s admin=%s",
-                        err_code,
-                        data.get("errMsg"),
-                        data.get("errDlt"),
-                        target_user,
-                    )
-                    return None
-
-                token = data.get("data", {}).get("token")
-                if not token:
-                    logger.error("Failed to get token: response missing token, admin=%s", target_user)
-                return token
+            data = response.json()
+            err_code = data.get("errCode")
+            if err_code not in (0, None):
+                logger.error(
+                    "Failed to get token (OpenIM errCode): errCode=%s errMsg=%s errDlt=%s admin=%s",
+                    err_code,
+                    data.get("errMsg"),
+                    data.get("errDlt"),
+                    target_user,
+                )
+                return None
+
+            token = data.get("data", {}).get("token")
+            if not token:
+                logger.error("Failed to get token: response missing token, admin=%s", target_user)
+            return token
         except Exception as e:  # pylint: disable=broad-except
             logger.error(
                 "Error getting OpenIM token: %s (verify_ssl=%s url=%s admin=%s)",
@@ -105,34 +123,44 @@ class OpenIMService:
         Returns:
             True if sent successfully
         """
-        try:
-            token = await self.get_token(from_user_id)
-            if not token:
-                logger.error("Failed to get OpenIM token")
-                return False
+        token = await self.get_token(from_user_id)
+        if not token:
+            logger.error("Failed to get OpenIM token")
+            return False
 
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/msg/send_msg",
-                    headers={"token": token},
-                    json={
-                        "sendID": from_user_id,
-                        "recvID": to_user_id,
-                        "senderPlatformID": self.platform_id,
-                        "contentType": content_type,
-                        "content": {
-                            "content": content
-                        }
-                    },
-                    timeout=10.0
-                )
+        return await self._post_message(token, from_user_id, to_user_id, content, content_type)
 
-                if response.status_code == 200:
-                    logger.info(f"Message sent from {from_user_id} to {to_user_id}")
-                    return True
-                else:
-                    logger.error(f"Failed to send message: {response.text}")
-                    return False
+    async def _post_message(
+        self,
+        token: str,
+        from_user_id: str,
+        to_user_id: str,
+        content: str,
+        content_type: int,
+    ) -> bool:
+        try:
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/msg/send_msg",
+                headers={"token": token},
+                json={
+                    "sendID": from_user_id,
+                    "recvID": to_user_id,
+                    "senderPlatformID": self.platform_id,
+                    "contentType": content_type,
+                    "content": {
+                        "content": content
+                    }
+                },
+                timeout=10.0
+            )
+
+            if response.status_code == 200:
+                logger.info(f"Message sent from {from_user_id} to {to_user_id}")
+                return True
+            else:
+                logger.error(f"Failed to send message: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Error sending OpenIM message: {e}")
@@ -148,6 +176,9 @@ class OpenIMService:
         """
         Send same message to multiple users.
 
+        Sends run concurrently, capped at ``OPENIM_BATCH_CONCURRENCY`` in flight,
+        and share a single sender token.
+
         Args:
             from_user_id: Sender user ID
             to_user_ids: List of recipient user IDs
@@ -157,15 +188,19 @@ class OpenIMService:
         Returns:
             Dict mapping user_id to success status
         """
-        results = {}
-        for user_id in to_user_ids:
-            success = await self.send_message(
-                from_user_id=from_user_id,
-                to_user_id=user_id,
-                content=content,
-                content_type=content_type
-            )
-            results[user_id] = success
+        token = await self.get_token(from_user_id)
+        if not token:
+            logger.error("Failed to get OpenIM token")
+            return {user_id: False for user_id in to_user_ids}
+
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def _send_one(user_id: str) -> bool:
+            async with semaphore:
+                return await self._post_message(token, from_user_id, user_id, content, content_type)
+
+        outcomes = await asyncio.gather(*(_send_one(user_id) for user_id in to_user_ids))
+        results = dict(zip(to_user_ids, outcomes))
 
         success_count = sum(1 for v in results.values() if v)
         logger.info(
@@ -203,23 +238,23 @@ class OpenIMService:
         }
 
         try:
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/conversation/get_sorted_conversation_list",
-                    headers=headers,
-                    json=payload,
-                    timeout=10.0,
-                )
-                if response.status_code != 200:
-                    logger.error(f"OpenIM conversation list failed: {response.text}")
-                    return {}
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/conversation/get_sorted_conversation_list",
+                headers=headers,
+                json=payload,
+                timeout=10.0,
+            )
+            if response.status_code != 200:
+                logger.error(f"OpenIM conversation list failed: {response.text}")
+                return {}
 
-                data = response.json()
-                if data.get("errCode") != 0:
-                    logger.error(f"OpenIM conversation list error: {data}")
-                    return {}
+            data = response.json()
+            if data.get("errCode") != 0:
+                logger.error(f"OpenIM conversation list error: {data}")
+                return {}
 
-                return data.get("data") or {}
+            return data.get("data") or {}
 
         except Exception as exc:  # pylint: disable=broad-except
             logger.error(f"Error fetching OpenIM conversation list: {exc}")
@@ -249,28 +284,28 @@ class OpenIMService:
             if not token:
                 return []
 
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/msg/get_conversation_msg",
-                    headers={"token": token},
-                    json={
-                        "conversationID": conversation_id,
-                        "offset": offset,
-                        "count": limit
-                    },
-                    timeout=10.0
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/msg/get_conversation_msg",
+                headers={"token": token},
+                json={
+                    "conversationID": conversation_id,
+                    "offset": offset,
+                    "count": limit
+                },
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    messages = data.get("data", {}).get("messages", [])
-                    logger.info(
-                        f"Fetched {len(messages)} messages from {conversation_id}"
-                    )
-                    return messages
-                else:
-                    logger.error(f"Failed to fetch messages: {response.text}")
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                messages = data.get("data", {}).get("messages", [])
+                logger.info(
+                    f"Fetched {len(messages)} messages from {conversation_id}"
+                )
+                return messages
+            else:
+                logger.error(f"Failed to fetch messages: {response.text}")
+                return []
 
         except Exception as e:
             logger.error(f"Error fetching OpenIM messages: {e}")
@@ -296,21 +331,21 @@ class OpenIMService:
             if not token:
                 return 0
 
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/conversation/get_conversation",
-                    headers={"token": token},
-                    json={
-                        "conversationID": conversation_id,
-                        "ownerUserID": user_id
-                    },
-                    timeout=10.0
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/conversation/get_conversation",
+                headers={"token": token},
+                json={
+                    "conversationID": conversation_id,
+                    "ownerUserID": user_id
+                },
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    conversation = data.get("data", {}).get("conversation", {})
-                    return conversation.get("unreadCount", 0)
+            if response.status_code == 200:
+                data = response.json()
+                conversation = data.get("data", {}).get("conversation", {})
+                return conversation.get("unreadCount", 0)
 
         except Exception as e:
             logger.error(f"Error getting unread count: {e}")
@@ -339,25 +374,25 @@ class OpenIMService:
             if not token:
                 return False
 
-            async with httpx.AsyncClient(verify=self.verify_ssl) as client:
-                response = await client.post(
-                    f"{self.api_url}/msg/mark_msgs_as_read",
-                    headers={"token": token},
-                    json={
-                        "conversationID": conversation_id,
-                        "msgIDs": msg_ids
-                    },
-                    timeout=10.0
-                )
+            client = self._get_client()
+            response = await client.post(
+                f"{self.api_url}/msg/mark_msgs_as_read",
+                headers={"token": token},
+                json={
+                    "conversationID": conversation_id,
+                    "msgIDs": msg_ids
+                },
+                timeout=10.0
+            )
 
-                if response.status_code == 200:
-                    logger.info(
-                        f"Marked {len(msg_ids)} messages as read in {conversation_id}"
-                    )
-                    return True
-                else:
-                    logger.error(f"Failed to mark as read: {response.text}")
-                    return False
+            if response.status_code == 200:
+                logger.info(
+                    f"Marked {len(msg_ids)} messages as read in {conversation_id}"
+                )
+                return True
+            else:
+                logger.error(f"Failed to mark as read: {response.text}")
+                return False
 
         except Exception as e:
             logger.error(f"Error marking messages as read: {e}")
@@ -0,0 +1,26 @@
+"""Operator identity lookups shared by services."""
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.user import Author
+from app.services.cache_service import cache_service
+
+OPERATOR_NAME_CACHE_NS = "operator-name"
+OPERATOR_NAME_TTL = 300
+
+
+async def get_operator_username(db: AsyncSession, operator_id: str) -> Optional[str]:
+    """从authors表反查运营用户名，结果在Redis缓存5分钟（含未命中）。"""
+    if not operator_id:
+        return None
+
+    cache_key = cache_service.key(OPERATOR_NAME_CACHE_NS, operator_id)
+    cached = await cache_service.get(cache_key)
+    if cached is not None:
+        return cached.decode("utf-8") or None
+
+    username = await db.scalar(select(Author.username).where(Author.id == operator_id))
+    await cache_service.set(cache_key, username or "", expire=OPERATOR_NAME_TTL)
+    return username
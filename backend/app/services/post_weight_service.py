@@ -1,11 +1,11 @@
 """Post weight service."""
 from datetime import datetime
-from typing import Dict, Iterable, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import case, func, insert, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
@@ -16,6 +16,12 @@ from app.schemas.post_weight import (
     PostWeightListResponse,
     PostWeightResponse,
 )
+from app.services.cache_service import cache_service
+from app.utils.pagination import decode_cursor, encode_cursor, parse_cursor_datetime
+
+
+POST_WEIGHTS_CACHE_NS = "post-weights"
+POST_WEIGHTS_COUNT_TTL = 30
 
 
 class PostWeightService:
@@ -34,14 +40,12 @@ class PostWeightService:
         return segments[-1]
 
     @staticmethod
-    def _normalize_urls(post_urls: str) -> List[Tuple[str, str]]:
+    def _normalize_urls(post_urls: List[str]) -> List[Tuple[str, str]]:
         normalized: List[Tuple[str, str]] = []
         seen_ids: set[str] = set()
 
-        for raw in post_urls.split(","):
-            url = raw.strip()
-            if not url:
-                continue
+        # 请求体已完成拆分与去空白
+        for url in post_urls:
             try:
                 post_id = PostWeightService._extract_post_id(url)
             except ValueError as exc:
@@ -76,106 +80,157 @@ class PostWeightService:
                 detail=f"以下post_id不存在: {', '.join(missing_ids)}"
             )
 
-        # Fetch existing weights
-        weight_stmt = select(PostWeight).where(PostWeight.post_id.in_(post_ids))
-        weight_result = await self.db.execute(weight_stmt)
-        existing_weights: Dict[str, PostWeight] = {
-            item.post_id: item for item in weight_result.scalars().all()
-        }
+        # Existing weight rows are updated in place, the rest inserted; both with RETURNING.
+        # post_id is not unique (soft-deleted duplicates may exist), so pick exactly one
+        # row per post_id to update: the live row if any, otherwise the newest one.
+        weight_stmt = (
+            select(PostWeight.post_id, PostWeight.id)
+            .where(PostWeight.post_id.in_(post_ids))
+            .distinct(PostWeight.post_id)
+            .order_by(PostWeight.post_id, PostWeight.deleted_at.is_not(None), PostWeight.id.desc())
+        )
+        target_row_ids: Dict[str, int] = dict((await self.db.execute(weight_stmt)).all())
 
         now = datetime.utcnow()
         operator = operator_id
         operator_display_name = payload.operator or operator_name or operator_id
 
-        affected_records: List[PostWeight] = []
+        records_by_post: Dict[str, PostWeight] = {}
 
-        # Upsert logic
-        for post_url, post_id in pairs:
-            record = existing_weights.get(post_id)
-            if record is None:
-                record = PostWeight(
-                    post_url=post_url,
-                    post_id=post_id,
+        update_urls = {post_id: post_url for post_url, post_id in pairs if post_id in target_row_ids}
+        if update_urls:
+            update_stmt = (
+                update(PostWeight)
+                .where(PostWeight.id.in_([target_row_ids[post_id] for post_id in update_urls]))
+                .values(
+                    post_url=case(update_urls, value=PostWeight.post_id),
                     weight=payload.weight,
                     operator=operator,
                     operator_name=operator_display_name,
-                    created_at=now,
+                    deleted_at=None,
                     updated_at=now,
                 )
-                self.db.add(record)
-            else:
-                record.post_url = post_url
-                record.weight = payload.weight
-                record.operator = operator
-                record.operator_name = operator_display_name
-                record.deleted_at = None
-                record.updated_at = now
-
-            affected_records.append(record)
-
-        await self.db.flush()
+                .returning(PostWeight)
+                .execution_options(synchronize_session=False)
+            )
+            for record in (await self.db.scalars(update_stmt)).all():
+                records_by_post[record.post_id] = record
+
+        insert_rows = [
+            {
+                "post_url": post_url,
+                "post_id": post_id,
+                "weight": payload.weight,
+                "operator": operator,
+                "operator_name": operator_display_name,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for post_url, post_id in pairs
+            if post_id not in target_row_ids
+        ]
+        if insert_rows:
+            inserted = await self.db.scalars(insert(PostWeight).returning(PostWeight), insert_rows)
+            for record in inserted.all():
+                records_by_post[record.post_id] = record
 
         # Notify recommendation service before committing
         await self._notify_recommendation(post_ids)
 
         await self.db.commit()
+        await self._invalidate_count()
 
-        # Refresh records to return latest values
-        for record in affected_records:
-            await self.db.refresh(record)
-
-        return [PostWeightResponse.model_validate(record) for record in affected_records]
+        affected_records = [records_by_post[post_id] for post_id in post_ids if post_id in records_by_post]
+        return [PostWeightResponse.from_record(record) for record in affected_records]
 
     async def list_post_weights(
         self,
         page: int,
         page_size: int,
+        cursor: Optional[str] = None,
     ) -> PostWeightListResponse:
-        """List post weight records."""
+        """List post weight records.
+
+        传入 ``cursor`` 时按 (updated_at, id) 做 keyset 翻页，避免深分页的 OFFSET 扫描；
+        ``page`` 仅为兼容旧客户端保留。
+        """
         if page < 1 or page_size < 1:
             raise HTTPException(status_code=400, detail="分页参数不合法")
 
         base_condition = PostWeight.deleted_at.is_(None)
 
-        count_stmt = select(func.count()).select_from(PostWeight).where(base_condition)
-        total = await self.db.scalar(count_stmt) or 0
+        total = await self._count_active()
 
         stmt = (
             select(PostWeight)
             .where(base_condition)
-            .order_by(PostWeight.updated_at.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+            .order_by(PostWeight.updated_at.desc(), PostWeight.id.desc())
+            .limit(page_size + 1)
         )
+        if cursor:
+            c_ts, c_id = decode_cursor(cursor, 2)
+            if not isinstance(c_id, int):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(
+                tuple_(PostWeight.updated_at, PostWeight.id) < (parse_cursor_datetime(c_ts), c_id)
+            )
+        elif page > 1:
+            stmt = stmt.offset((page - 1) * page_size)
+
         result = await self.db.execute(stmt)
-        items = [PostWeightResponse.model_validate(record) for record in result.scalars().all()]
+        records = list(result.scalars().all())
+
+        next_cursor = None
+        if len(records) > page_size:
+            records = records[:page_size]
+            last = records[-1]
+            next_cursor = encode_cursor((last.updated_at, last.id))
+
+        items = [PostWeightResponse.from_record(record) for record in records]
 
         return PostWeightListResponse(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
+            next_cursor=next_cursor,
         )
 
+    async def _count_active(self) -> int:
+        """未删除记录总数；翻页间隔内基本不变，缓存短时间避免每次全表 COUNT。"""
+        cache_key = cache_service.key(POST_WEIGHTS_CACHE_NS, "count")
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return int(cached)
+
+        count_stmt = select(func.count()).select_from(PostWeight).where(PostWeight.deleted_at.is_(None))
+        total = await self.db.scalar(count_stmt) or 0
+        await cache_service.set(cache_key, str(total), expire=POST_WEIGHTS_COUNT_TTL)
+        return total
+
+    @staticmethod
+    async def _invalidate_count() -> None:
+        await cache_service.delete(cache_service.key(POST_WEIGHTS_CACHE_NS, "count"))
+
     async def soft_delete(self, record_id: int) -> None:
         """Soft delete a post weight record."""
-        stmt = select(PostWeight).where(
-            PostWeight.id == record_id,
-            PostWeight.deleted_at.is_(None),
+        now = datetime.utcnow()
+        stmt = (
+            update(PostWeight)
+            .where(PostWeight.id == record_id, PostWeight.deleted_at.is_(None))
+            .values(deleted_at=now, updated_at=now)
+            .returning(PostWeight.post_id)
+            .execution_options(synchronize_session=False)
         )
-        result = await self.db.execute(stmt)
-        record = result.scalar_one_or_none()
+        post_id = (await self.db.execute(stmt)).scalar_one_or_none()
 
-        if not record:
+        if post_id is None:
             raise HTTPException(status_code=404, detail="记录不存在或已删除")
 
-        record.deleted_at = datetime.utcnow()
-        record.updated_at = datetime.utcnow()
-        await self.db.flush()
-
-        await self._notify_remove([record.post_id])
+        await self._notify_remove([post_id])
 
         await self.db.commit()
+        await self._invalidate_count()
 
     async def cancel_weights(self, post_ids: List[str]) -> Dict[str, int]:
         """批量取消帖子权重并同步推荐系统。"""
@@ -185,25 +240,23 @@ class PostWeightService:
         if not normalized_ids:
             raise HTTPException(status_code=400, detail="post_ids不能为空")
 
-        stmt = select(PostWeight).where(
-            PostWeight.post_id.in_(normalized_ids),
-            PostWeight.deleted_at.is_(None),
-        )
-        result = await self.db.execute(stmt)
-        records = result.scalars().all()
-
         now = datetime.utcnow()
-        updated = 0
-        for record in records:
-            record.deleted_at = now
-            record.updated_at = now
-            updated += 1
-
-        await self.db.flush()
+        stmt = (
+            update(PostWeight)
+            .where(
+                PostWeight.post_id.in_(normalized_ids),
+                PostWeight.deleted_at.is_(None),
+            )
+            .values(deleted_at=now, updated_at=now)
+            .returning(PostWeight.id)
+            .execution_options(synchronize_session=False)
+        )
+        updated = len((await self.db.execute(stmt)).all())
 
         await self._notify_remove(normalized_ids)
 
         await self.db.commit()
+        await self._invalidate_count()
 
         return {"requested": len(normalized_ids), "updated": updated}
 
@@ -1,19 +1,26 @@
 """Support service for会话状态管理."""
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import json
+import logging
 import mimetypes
+import os
+import time
 import uuid
 import zlib
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set
 
-from fastapi import HTTPException
-from sqlalchemy import select, text, func
+from fastapi import HTTPException, UploadFile
+from sqlalchemy import select, text, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.database import SessionManager
 from app.models.support import SupportQuickMessage, SupportChatStatus, SupportCase
 from app.models.user import Author, User, UserWallet
 from app.schemas.support import (
@@ -38,9 +45,28 @@ from app.schemas.support import (
     SupportCaseListResponse,
 )
 from app.services.audit_service import AuditService
+from app.services.cache_service import cache_service
 from app.services.openim_service import openim_service
+from app.services.operator_service import get_operator_username
+from app.utils.pagination import decode_cursor, encode_cursor, parse_cursor_datetime
 from app.utils.r2_storage import R2Config, R2StorageClient, R2StorageError
 
+logger = logging.getLogger(__name__)
+
+QUICK_MESSAGES_CACHE_NS = "quick-messages"
+
+# 会话详情 stale-while-revalidate：软过期后先返回旧值并后台刷新，硬过期由 Redis TTL 控制
+CONVERSATION_DETAIL_CACHE_NS = "conversation-detail"
+CONVERSATION_DETAIL_SOFT_TTL = 30
+CONVERSATION_DETAIL_HARD_TTL = 300
+_detail_refresh_limit = asyncio.Semaphore(4)
+_detail_refreshing: Set[str] = set()
+_detail_refresh_tasks: Set[asyncio.Task] = set()
+
+# 会话列表依赖 OpenIM 拉取，短 TTL 缓存序列化后的响应体；状态变更时整体失效
+CONVERSATION_LIST_CACHE_NS = "conversation-list"
+CONVERSATION_LIST_CACHE_TTL = 5
+
 
 async def _resolve_operator_display_name(
     db: AsyncSession,
@@ -52,22 +78,43 @@ async def _resolve_operator_display_name(
     if not operator_id:
         return fallback or ""
 
-    stmt = select(Author.username).where(Author.id == operator_id)
-    username = await db.scalar(stmt)
+    username = await get_operator_username(db, operator_id)
     if username:
         return username
 
     return fallback or operator_id
 
 
+def _schedule_detail_refresh(conversation_id: str) -> None:
+    if conversation_id in _detail_refreshing:
+        return
+    _detail_refreshing.add(conversation_id)
+    task = asyncio.create_task(_refresh_conversation_detail(conversation_id))
+    _detail_refresh_tasks.add(task)
+    task.add_done_callback(_detail_refresh_tasks.discard)
+
+
+async def _refresh_conversation_detail(conversation_id: str) -> None:
+    try:
+        async with _detail_refresh_limit:
+            async with SessionManager() as db:
+                await SupportService(db)._load_conversation_detail(conversation_id)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("Background refresh of conversation %s failed: %s", conversation_id, exc)
+    finally:
+        _detail_refreshing.discard(conversation_id)
+
+
 class SupportService:
     """客服会话状态管理."""
 
+    # 进程级常量，不随请求重复初始化
+    uid_salt = settings.AGORA_UID_SALT or "JyzuC2!EPq8@EvF-zdqjdsh6NTpkr_nz"
+    MAX_UID = 2_147_483_647
+
     def __init__(self, db: AsyncSession):
         self.db = db
         self.audit_service = AuditService(db)
-        self.uid_salt = settings.AGORA_UID_SALT or "JyzuC2!EPq8@EvF-zdqjdsh6NTpkr_nz"
-        self.MAX_UID = 2_147_483_647
 
 
     # ----------------------------- Support Case CRUD ----------------------------- #
@@ -98,7 +145,9 @@ class SupportService:
         page_size: int,
         status: Optional[str] = None,
         user_id: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> SupportCaseListResponse:
+        """分页查询工单；传入 ``cursor`` 时按 (created_at, id) keyset 翻页，``page`` 仅兼容旧客户端。"""
         stmt = select(SupportCase)
         if status:
             stmt = stmt.where(SupportCase.status == status)
@@ -108,13 +157,35 @@ class SupportService:
         count_stmt = select(func.count()).select_from(stmt.subquery())
         total = await self.db.scalar(count_stmt) or 0
 
-        stmt = stmt.order_by(SupportCase.created_at.desc())
-        stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+        stmt = stmt.order_by(SupportCase.created_at.desc(), SupportCase.id.desc()).limit(page_size + 1)
+        if cursor:
+            c_ts, c_id = decode_cursor(cursor, 2)
+            if not isinstance(c_id, str):
+                raise HTTPException(status_code=400, detail="Invalid cursor")
+            stmt = stmt.where(
+                tuple_(SupportCase.created_at, SupportCase.id) < (parse_cursor_datetime(c_ts), c_id)
+            )
+        elif page > 1:
+            stmt = stmt.offset((page - 1) * page_size)
 
         result = await self.db.execute(stmt)
-        items = [SupportCaseItem.model_validate(row) for row in result.scalars().all()]
+        cases = list(result.scalars().all())
 
-        return SupportCaseListResponse(items=items, total=total, page=page, page_size=page_size)
+        next_cursor = None
+        if len(cases) > page_size:
+            cases = cases[:page_size]
+            last = cases[-1]
+            next_cursor = encode_cursor((last.created_at, last.id))
+
+        items = [SupportCaseItem.model_validate(row) for row in cases]
+
+        return SupportCaseListResponse(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            next_cursor=next_cursor,
+        )
 
     async def update_case(self, case_id: str, payload: SupportCaseUpdateRequest) -> SupportCaseItem:
         stmt = select(SupportCase).where(SupportCase.id == case_id)
@@ -165,12 +236,36 @@ class SupportService:
             self.db.add(existing)
 
         await self.db.commit()
+        await cache_service.delete(
+            cache_service.key(CONVERSATION_DETAIL_CACHE_NS, payload.openim_conversation_id)
+        )
+        await cache_service.clear_namespace(CONVERSATION_LIST_CACHE_NS)
         return SupportConversationCreateResponse(
             conversation_id=payload.openim_conversation_id,
             status=existing.status,
         )
 
     # ------------------------------------------------------------------ #
+    async def list_conversations_body(
+        self,
+        query: SupportConversationQuery,
+        render: Callable[[SupportConversationListResponse], bytes],
+    ) -> bytes:
+        """
+        Serialized conversation list; cache hits skip OpenIM, the DB and pydantic entirely.
+
+        ``render`` builds the final response body so the cached bytes can be returned as-is.
+        """
+        digest = hashlib.blake2b(query.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+        cache_key = cache_service.key(CONVERSATION_LIST_CACHE_NS, digest)
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return cached
+
+        body = render(await self.list_conversations(query))
+        await cache_service.set(cache_key, body, expire=CONVERSATION_LIST_CACHE_TTL)
+        return body
+
     async def list_conversations(
         self,
         query: SupportConversationQuery,
@@ -200,8 +295,7 @@ class SupportService:
             if peer_user_id:
                 peer_user_ids.add(peer_user_id)
 
-            status_row = status_map.get(conv_id)
-            status_value = status_row.status if status_row else "pending"
+            status_value = status_map.get(conv_id, "pending")
             last_message, last_message_at = self._extract_latest_message(msg_info)
 
             parsed_rows.append(
@@ -216,17 +310,28 @@ class SupportService:
 
         profiles = await self._build_bulk_profiles(peer_user_ids)
 
+        # 过滤条件在请求内只归一化一次，逐行只做子串匹配
+        status_filter = query.status
+        uid_needle = query.uid.lower() if query.uid else None
+        profile_needles = [
+            (attr, needle.lower())
+            for attr, needle in (
+                ("username", query.username),
+                ("display_name", query.display_name),
+                ("wallet_address", query.wallet_address),
+            )
+            if needle
+        ]
+
         def _match_filters(row_profile: Optional[SupportConversationUserProfile], row_status: str, peer_user_id: Optional[str]) -> bool:
-            if query.status and row_status != query.status:
+            if status_filter and row_status != status_filter:
                 return False
-            if query.uid and (not peer_user_id or query.uid.lower() not in peer_user_id.lower()):
-                return False
-            if query.username and (not row_profile or not row_profile.username or query.username.lower() not in row_profile.username.lower()):
-                return False
-            if query.display_name and (not row_profile or not row_profile.display_name or query.display_name.lower() not in row_profile.display_name.lower()):
-                return False
-            if query.wallet_address and (not row_profile or not row_profile.wallet_address or query.wallet_address.lower() not in row_profile.wallet_address.lower()):
+            if uid_needle and (not peer_user_id or uid_needle not in peer_user_id.lower()):
                 return False
+            for attr, needle in profile_needles:
+                value = getattr(row_profile, attr) if row_profile else None
+                if not value or needle not in value.lower():
+                    return False
             return True
 
         items: List[SupportConversationListItem] = []
@@ -236,7 +341,7 @@ class SupportService:
                 continue
 
             items.append(
-                SupportConversationListItem(
+                SupportConversationListItem.model_construct(
                     conversation_id=row["conversation_id"],
                     openim_conversation_id=row["conversation_id"],
                     user_id=row["peer_user_id"] or "",
@@ -272,6 +377,16 @@ class SupportService:
 
     # ------------------------------------------------------------------ #
     async def get_conversation_detail(self, conversation_id: str) -> SupportConversationDetailResponse:
+        cached = await cache_service.get(cache_service.key(CONVERSATION_DETAIL_CACHE_NS, conversation_id))
+        if cached is not None:
+            envelope = json.loads(cached)
+            if time.time() - envelope["ts"] > CONVERSATION_DETAIL_SOFT_TTL:
+                _schedule_detail_refresh(conversation_id)
+            return SupportConversationDetailResponse.model_validate(envelope["data"])
+
+        return await self._load_conversation_detail(conversation_id)
+
+    async def _load_conversation_detail(self, conversation_id: str) -> SupportConversationDetailResponse:
         status_row = await self._get_status_record(conversation_id)
         peer_user_id = status_row.peer_user_id if status_row else self._extract_peer_user_id(conversation_id, None)
 
@@ -285,7 +400,7 @@ class SupportService:
         if not profile:
             raise HTTPException(status_code=404, detail="Conversation user not found")
 
-        return SupportConversationDetailResponse(
+        detail = SupportConversationDetailResponse(
             conversation_id=conversation_id,
             openim_conversation_id=conversation_id,
             status=status_row.status if status_row else "pending",
@@ -294,6 +409,13 @@ class SupportService:
             messages=[],  # 不持久化消息，需实时从OpenIM拉取时再补充
             user_profile=profile,
         )
+        envelope = {"ts": time.time(), "data": detail.model_dump(mode="json")}
+        await cache_service.set(
+            cache_service.key(CONVERSATION_DETAIL_CACHE_NS, conversation_id),
+            json.dumps(envelope),
+            expire=CONVERSATION_DETAIL_HARD_TTL,
+        )
+        return detail
 
     # ------------------------------------------------------------------ #
     async def update_status(
@@ -319,6 +441,8 @@ class SupportService:
         status_row.updated_at = datetime.utcnow()
 
         await self.db.commit()
+        await cache_service.delete(cache_service.key(CONVERSATION_DETAIL_CACHE_NS, conversation_id))
+        await cache_service.clear_namespace(CONVERSATION_LIST_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -374,14 +498,16 @@ class SupportService:
         result = await self.db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def _get_status_map(self, conversation_ids: List[str]) -> Dict[str, SupportChatStatus]:
+    async def _get_status_map(self, conversation_ids: List[str]) -> Dict[str, str]:
+        """conversation_id -> status；列表只需要状态列，不加载整行 ORM 对象。"""
         if not conversation_ids:
             return {}
 
-        stmt = select(SupportChatStatus).where(SupportChatStatus.conversation_id.in_(conversation_ids))
+        stmt = select(SupportChatStatus.conversation_id, SupportChatStatus.status).where(
+            SupportChatStatus.conversation_id.in_(conversation_ids)
+        )
         result = await self.db.execute(stmt)
-        rows = result.scalars().all()
-        return {row.conversation_id: row for row in rows}
+        return {conversation_id: status for conversation_id, status in result}
 
     def _extract_peer_user_id(self, conversation_id: Optional[str], msg_info: Optional[Dict[str, Any]]) -> Optional[str]:
         admin_id = settings.OPENIM_ADMIN_USER_ID
@@ -451,16 +577,15 @@ class SupportService:
         for user, author in rows:
             user_map[user.id] = (user, author)
 
+        # DISTINCT ON 只取每个用户最新的钱包，避免把全部钱包拉回应用层再去重
         wallet_stmt = (
-            select(UserWallet.user_id, UserWallet.pubkey, UserWallet.created_at)
+            select(UserWallet.user_id, UserWallet.pubkey)
             .where(UserWallet.user_id.in_(user_ids))
             .order_by(UserWallet.user_id, UserWallet.created_at.desc().nullslast())
+            .distinct(UserWallet.user_id)
         )
         wallet_result = await self.db.execute(wallet_stmt)
-        wallet_map: Dict[str, str] = {}
-        for user_id, pubkey, _created_at in wallet_result:
-            if user_id not in wallet_map:
-                wallet_map[user_id] = pubkey
+        wallet_map: Dict[str, str] = {user_id: pubkey for user_id, pubkey in wallet_result}
 
         im_rows = await self.db.execute(
             text("SELECT toci_id, im_id FROM toci_im WHERE toci_id = ANY(:ids)"),
@@ -499,10 +624,15 @@ class SupportQuickMessageService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.audit_service = AuditService(db)
-        self._r2_client: Optional[R2StorageClient] = None
 
     # ----------------------------- CRUD ----------------------------- #
     async def list_quick_messages(self, active_only: bool) -> SupportQuickMessageListResponse:
+        # 快捷消息为全体客服共享的模板，不含个人数据，缓存 key 无需区分操作人
+        cache_key = cache_service.key(QUICK_MESSAGES_CACHE_NS, int(active_only))
+        cached = await cache_service.get(cache_key)
+        if cached is not None:
+            return SupportQuickMessageListResponse.model_validate_json(cached)
+
         stmt = select(SupportQuickMessage)
         if active_only:
             stmt = stmt.where(SupportQuickMessage.is_active.is_(True))
@@ -514,7 +644,9 @@ class SupportQuickMessageService:
 
         result = await self.db.execute(stmt)
         items = [SupportQuickMessageItem.model_validate(row) for row in result.scalars().all()]
-        return SupportQuickMessageListResponse(items=items)
+        response = SupportQuickMessageListResponse(items=items)
+        await cache_service.set(cache_key, response.model_dump_json())
+        return response
 
     async def create_quick_message(
         self,
@@ -538,6 +670,7 @@ class SupportQuickMessageService:
         self.db.add(quick_message)
         await self.db.commit()
         await self.db.refresh(quick_message)
+        await cache_service.clear_namespace(QUICK_MESSAGES_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -569,6 +702,7 @@ class SupportQuickMessageService:
 
         await self.db.commit()
         await self.db.refresh(quick_message)
+        await cache_service.clear_namespace(QUICK_MESSAGES_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -585,6 +719,7 @@ class SupportQuickMessageService:
         title_snapshot = quick_message.title
         await self.db.delete(quick_message)
         await self.db.commit()
+        await cache_service.clear_namespace(QUICK_MESSAGES_CACHE_NS)
 
         await self.audit_service.log_action(
             operator_id=operator_id,
@@ -599,24 +734,29 @@ class SupportQuickMessageService:
         self,
         *,
         operator_id: str,
-        filename: Optional[str],
-        content_type: Optional[str],
-        data: bytes,
+        file: UploadFile,
     ) -> SupportQuickMessageUploadResponse:
-        if not data:
-            raise HTTPException(status_code=400, detail="上传内容为空")
-
-        max_size = settings.MAX_UPLOAD_SIZE or 10 * 1024 * 1024
-        if len(data) > max_size:
-            raise HTTPException(status_code=413, detail="图片大小超出限制")
-
-        detected_content_type = content_type or mimetypes.guess_type(filename or "")[0]
+        filename = file.filename
+        detected_content_type = file.content_type or mimetypes.guess_type(filename or "")[0]
         if not detected_content_type:
             detected_content_type = "application/octet-stream"
 
         if not detected_content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="仅支持图片格式上传")
 
+        # multipart 解析时文件已落入 SpooledTemporaryFile，这里只取大小、不读入内存
+        size = file.size
+        if size is None:
+            size = file.file.seek(0, os.SEEK_END)
+        file.file.seek(0)
+
+        if not size:
+            raise HTTPException(status_code=400, detail="上传内容为空")
+
+        max_size = settings.MAX_UPLOAD_SIZE or 10 * 1024 * 1024
+        if size > max_size:
+            raise HTTPException(status_code=413, detail="图片大小超出限制")
+
         suffix = Path(filename).suffix if filename else ""
         if not suffix:
             guessed = mimetypes.guess_extension(detected_content_type)
@@ -628,7 +768,7 @@ class SupportQuickMessageService:
 
         client = self._get_r2_client()
         try:
-            url = await client.upload_bytes(key=object_key, data=data, content_type=detected_content_type)
+            url = await client.upload_fileobj(key=object_key, fileobj=file.file, content_type=detected_content_type)
         except R2StorageError as exc:
             raise HTTPException(status_code=502, detail=str(exc)) from exc
 
@@ -636,7 +776,7 @@ class SupportQuickMessageService:
             key=object_key,
             url=url,
             content_type=detected_content_type,
-            size=len(data),
+            size=size,
         )
 
     # ----------------------------- helpers ----------------------------- #
@@ -648,28 +788,31 @@ class SupportQuickMessageService:
             raise HTTPException(status_code=404, detail="快捷消息不存在")
         return quick_message
 
-    def _get_r2_client(self) -> R2StorageClient:
-        if self._r2_client:
-            return self._r2_client
-
-        required = {
-            "CF_R2_ENDPOINT": settings.CF_R2_ENDPOINT,
-            "CF_R2_ACCESS_KEY_ID": settings.CF_R2_ACCESS_KEY_ID,
-            "CF_R2_SECRET_ACCESS_KEY": settings.CF_R2_SECRET_ACCESS_KEY,
-            "CF_R2_BUCKET": settings.CF_R2_BUCKET,
-        }
-        missing = [key for key, value in required.items() if not value]
-        if missing:
-            raise HTTPException(status_code=500, detail=f"R2配置缺失: {', '.join(missing)}")
-
-        public_url = settings.CF_R2_IMAGES_MEMEFANS_ACCESS_URL or settings.CF_R2_FILES_MEMEFANS_ACCESS_URL
-
-        config = R2Config(
-            endpoint_url=settings.CF_R2_ENDPOINT,
-            access_key_id=settings.CF_R2_ACCESS_KEY_ID,
-            secret_access_key=settings.CF_R2_SECRET_ACCESS_KEY,
-            bucket=settings.CF_R2_BUCKET,
-            public_base_url=public_url,
-        )
-        self._r2_client = R2StorageClient(config)
-        return self._r2_client
+    @staticmethod
+    def _get_r2_client() -> R2StorageClient:
+        return _shared_r2_client()
+
+
+@lru_cache(maxsize=1)
+def _shared_r2_client() -> R2StorageClient:
+    """进程内复用同一个 boto3 S3 client（线程安全），避免每次上传重建 session。"""
+    required = {
+        "CF_R2_ENDPOINT": settings.CF_R2_ENDPOINT,
+        "CF_R2_ACCESS_KEY_ID": settings.CF_R2_ACCESS_KEY_ID,
+        "CF_R2_SECRET_ACCESS_KEY": settings.CF_R2_SECRET_ACCESS_KEY,
+        "CF_R2_BUCKET": settings.CF_R2_BUCKET,
+    }
+    missing = [key for key, value in required.items() if not value]
+    if missing:
+        raise HTTPException(status_code=500, detail=f"R2配置缺失: {', '.join(missing)}")
+
+    public_url = settings.CF_R2_IMAGES_MEMEFANS_ACCESS_URL or settings.CF_R2_FILES_MEMEFANS_ACCESS_URL
+
+    config = R2Config(
+        endpoint_url=settings.CF_R2_ENDPOINT,
+        access_key_id=settings.CF_R2_ACCESS_KEY_ID,
+        secret_access_key=settings.CF_R2_SECRET_ACCESS_KEY,
+        bucket=settings.CF_R2_BUCKET,
+        public_base_url=public_url,
+    )
+    return R2StorageClient(config)
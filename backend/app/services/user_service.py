@@ -8,9 +8,9 @@ import jwt
 
 import httpx
 from fastapi import HTTPException
-from sqlalchemy import and_, func, or_, select, text
+from sqlalchemy import and_, func, lambda_stmt, or_, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.config import settings
 from app.models.user import Author, Ban, User, UserWallet
@@ -32,19 +32,44 @@ from app.schemas.user import (
 )
 from app.services.audit_service import AuditService
 from app.services.notification_service import notification_service
+from app.services.operator_service import get_operator_username
 
 logger = logging.getLogger(__name__)
 
+# 外部封禁/解封接口共用的连接池，避免每次调用都重新握手 TCP/TLS
+_EXTERNAL_API_TIMEOUT = httpx.Timeout(connect=5.0, read=45.0, write=10.0, pool=5.0)
+_external_client: Optional[httpx.AsyncClient] = None
+
+
+def _get_external_client() -> httpx.AsyncClient:
+    global _external_client
+    if _external_client is None or _external_client.is_closed:
+        _external_client = httpx.AsyncClient(
+            timeout=_EXTERNAL_API_TIMEOUT,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _external_client
+
+
+async def close_external_client() -> None:
+    """Close the shared client used for the external ban/unban API."""
+    global _external_client
+    if _external_client is not None:
+        await _external_client.aclose()
+        _external_client = None
+
 
 class UserService:
     """User service."""
 
+    # 进程级常量，不随请求重复初始化
+    uid_salt = settings.AGORA_UID_SALT or "JyzuC2!EPq8@EvF-zdqjdsh6NTpkr_nz"
+    MAX_UID = 2_147_483_647
+    notification_service = notification_service
+
     def __init__(self, db: AsyncSession):
         self.db = db
-        self.notification_service = notification_service
         self.audit_service = AuditService(db)
-        self.uid_salt = settings.AGORA_UID_SALT or "JyzuC2!EPq8@EvF-zdqjdsh6NTpkr_nz"
-        self.MAX_UID = 2_147_483_647
 
     def _resolve_operator_id(self, preferred_id: Optional[str]) -> str:
         if preferred_id:
@@ -56,8 +81,7 @@ class UserService:
         if not operator_id:
             return ""
 
-        stmt = select(Author.username).where(Author.id == operator_id)
-        username = await self.db.scalar(stmt)
+        username = await get_operator_username(self.db, operator_id)
         if username:
             return username
 
@@ -92,11 +116,11 @@ class UserService:
     async def get_users(self, params: UserSearchParams) -> UserListResponse:
         """Get user list with search and pagination - joining users, authors, and wallets."""
 
-        # Build base query joining users with authors
-        query = select(User).options(
-            selectinload(User.author),
+        # Build base query: author (1:1) joined in the same round trip, wallets (1:N)
+        # batched with a single IN query; total comes from a window count on the page query.
+        query = select(User, func.count().over().label("total_count")).options(
+            joinedload(User.author),
             selectinload(User.wallets),
-            selectinload(User.bans)
         )
 
         # Apply filters
@@ -140,10 +164,6 @@ class UserService:
         if filters:
             query = query.where(and_(*filters))
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query) or 0
-
         # Apply sorting
         sort_column = getattr(User, params.sort_by, User.created_at)
         if params.sort_order == "desc":
@@ -157,16 +177,27 @@ class UserService:
 
         # Execute query
         result = await self.db.execute(query)
-        users = result.scalars().all()
+        rows = result.all()
+        users = [row[0] for row in rows]
+        if rows:
+            total = rows[0].total_count
+        elif params.page > 1:
+            # 页码越界时窗口计数拿不到值，退回单独 COUNT
+            count_query = select(func.count()).select_from(User)
+            if filters:
+                count_query = count_query.where(and_(*filters))
+            total = await self.db.scalar(count_query) or 0
+        else:
+            total = 0
 
         # Build response
         items: list[UserListItemResponse] = []
         for user in users:
-            wallet_models = [WalletResponse.model_validate(w) for w in user.wallets]
-            bsc_wallet = next((w.pubkey for w in wallet_models if w.type == "bsc"), None)
+            bsc_wallet = next((w.pubkey for w in user.wallets if w.type == "bsc"), None)
 
+            # 字段直接来自数据库行，出参无需再走一遍校验
             items.append(
-                UserListItemResponse(
+                UserListItemResponse.model_construct(
                     user_id=user.id,
                     username=user.author.username if user.author else None,
                     display_name=user.author.name if user.author else None,
@@ -187,9 +218,11 @@ class UserService:
 
     async def get_user_detail(self, user_id: str) -> UserDetailResponse:
         """Get user detail with author and wallet information."""
-        query = select(User).where(User.id == user_id).options(
-            selectinload(User.author),
-            selectinload(User.wallets),
+        query = lambda_stmt(
+            lambda: select(User).where(User.id == user_id).options(
+                joinedload(User.author),
+                selectinload(User.wallets),
+            )
         )
         result = await self.db.execute(query)
         user = result.scalar_one_or_none()
@@ -513,15 +546,13 @@ class UserService:
             {k: v for k, v in headers.items() if k.lower() != "authorization"},
         )
 
-        timeout = httpx.Timeout(connect=5.0, read=45.0, write=10.0, pool=5.0)
-
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    endpoint,
-                    json=payload,
-                    headers=headers,
-                )
+            client = _get_external_client()
+            response = await client.post(
+                endpoint,
+                json=payload,
+                headers=headers,
+            )
 
             if response.status_code != 200:
                 logger.error(
@@ -588,11 +619,9 @@ class UserService:
             {k: v for k, v in headers.items() if k.lower() != "authorization"},
         )
 
-        timeout = httpx.Timeout(connect=5.0, read=45.0, write=10.0, pool=5.0)
-
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(endpoint, **request_kwargs)
+            client = _get_external_client()
+            response = await client.post(endpoint, **request_kwargs)
 
             if response.status_code != 200:
                 logger.error(
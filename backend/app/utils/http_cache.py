@@ -0,0 +1,49 @@
+"""Conditional GET helpers (ETag / 304 Not Modified)."""
+import hashlib
+from typing import Mapping, Optional
+
+from fastapi import Request
+from fastapi.responses import Response as HTTPResponse
+
+# For anonymous, near-static payloads only: lets a CDN / reverse proxy serve them.
+# Never use on routes whose body depends on the operator identity.
+PUBLIC_CACHE_CONTROL = "public, max-age=60, stale-while-revalidate=300"
+
+
+def compute_etag(body: bytes) -> str:
+    """Strong ETag derived from the serialized response body."""
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already covers ``etag``."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def conditional_json_response(
+    request: Request,
+    body: bytes,
+    *,
+    cache_control: str = "private, no-cache",
+    headers: Optional[Mapping[str, str]] = None,
+    etag: Optional[str] = None,
+) -> HTTPResponse:
+    """
+    Return the serialized JSON ``body``, or 304 when the client copy is current.
+
+    Pass a precomputed ``etag`` for bodies that are built once and reused.
+    """
+    etag = etag or compute_etag(body)
+    response_headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        **(headers or {}),
+    }
+    if etag_matches(request, etag):
+        return HTTPResponse(status_code=304, headers=response_headers)
+    return HTTPResponse(content=body, media_type="application/json", headers=response_headers)
@@ -0,0 +1,42 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+import json
+from datetime import datetime
+from typing import Annotated, Any, List, Sequence
+
+from fastapi import HTTPException, Query
+
+# Header used to flag offset-based pagination as deprecated.
+DEPRECATION_HEADER = "Deprecation"
+
+# Shared page/page_size query parameters; FastAPI copies the Query metadata per parameter
+PageQuery = Annotated[int, Query(ge=1, description="Page index (1-based)")]
+PageSizeQuery = Annotated[int, Query(ge=1, le=100, description="Page size")]
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row into an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor produced by :func:`encode_cursor`."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def parse_cursor_datetime(value: Any) -> datetime:
+    """Parse a datetime component stored in a cursor."""
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import boto3
 from botocore.client import Config as BotoConfig
@@ -49,16 +49,16 @@ class R2StorageClient:
     def public_base_url(self) -> Optional[str]:
         return self._config.public_base_url.rstrip("/") if self._config.public_base_url else None
 
-    async def upload_bytes(self, *, key: str, data: bytes, content_type: str) -> str:
-        """上传二进制数据并返回可访问URL（如配置)."""
+    async def upload_fileobj(self, *, key: str, fileobj: BinaryIO, content_type: str) -> str:
+        """流式上传文件对象（大文件自动分片），不把内容整体读入内存。"""
 
         try:
             await asyncio.to_thread(
-                self._client.put_object,
-                Bucket=self.bucket,
-                Key=key,
-                Body=data,
-                ContentType=content_type,
+                self._client.upload_fileobj,
+                fileobj,
+                self.bucket,
+                key,
+                ExtraArgs={"ContentType": content_type},
             )
         except (ClientError, BotoCoreError) as exc:
             raise R2StorageError(f"R2上传失败: {exc}") from exc
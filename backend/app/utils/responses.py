@@ -0,0 +1,26 @@
+"""Response helpers for pre-serialized JSON payloads."""
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import Response as HTTPResponse
+from pydantic import TypeAdapter
+
+
+def adapter_response(
+    adapter: TypeAdapter,
+    payload: Any,
+    *,
+    status_code: int = 200,
+    headers: Optional[Mapping[str, str]] = None,
+) -> HTTPResponse:
+    """
+    Serialize ``payload`` with a module-level cached ``TypeAdapter``.
+
+    Returning a ready Response bypasses FastAPI's response_model
+    validate-then-serialize pass; keep ``response_model`` on the route for OpenAPI.
+    """
+    return HTTPResponse(
+        content=adapter.dump_json(payload),
+        status_code=status_code,
+        media_type="application/json",
+        headers=headers,
+    )
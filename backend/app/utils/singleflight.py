@@ -0,0 +1,49 @@
+"""Request coalescing for concurrent identical reads."""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    Collapse concurrent calls sharing a key into one execution.
+
+    The first caller runs ``func``; callers arriving while it is in flight await
+    the same result (or exception). Nothing is cached once the call finishes.
+    Followers receive the leader's object, so treat results as read-only.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, "asyncio.Future[T]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        future = self._calls.get(key)
+        if future is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The leader was cancelled (client went away), not us: run our own call.
+                # If this task is being cancelled as well, honour that instead of retrying.
+                task = asyncio.current_task()
+                if future.cancelled() and not (task is not None and task.cancelling()):
+                    return await func()
+                raise
+
+        future = asyncio.get_running_loop().create_future()
+        # Mark the outcome as retrieved so a failure nobody waited on is not logged
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._calls[key] = future
+        try:
+            result = await func()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._calls.pop(key, None)
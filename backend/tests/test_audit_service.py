@@ -0,0 +1,148 @@
+"""Tests for the AuditBuffer background writer."""
+import asyncio
+from contextlib import suppress
+
+import pytest
+
+from app.services import audit_service
+from app.services.audit_service import AuditBuffer
+
+
+class _Database:
+    """SessionManager stand-in recording each executemany batch; the first ``failures`` writes raise."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.attempts = 0
+        self.batches = []
+        self.written = asyncio.Event()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self, statement, rows):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(rows))
+        self.written.set()
+
+
+@pytest.fixture
+def database(monkeypatch):
+    db = _Database()
+    monkeypatch.setattr(audit_service, "SessionManager", lambda: db)
+    return db
+
+
+def _rows(count: int):
+    return [{"operator_id": "op", "action_type": f"action-{i}"} for i in range(count)]
+
+
+async def _run_until_written(buffer: AuditBuffer, database: _Database) -> None:
+    task = asyncio.create_task(buffer.run_forever())
+    try:
+        async with asyncio.timeout(1):
+            await database.written.wait()
+    finally:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+
+async def test_full_batch_is_written_without_waiting_for_the_interval(database):
+    buffer = AuditBuffer()
+    buffer.BATCH_SIZE = 3
+    buffer.FLUSH_INTERVAL = 60
+    rows = _rows(3)
+    for row in rows:
+        buffer.put(row)
+
+    await _run_until_written(buffer, database)
+
+    assert database.batches == [rows]
+
+
+async def test_partial_batch_is_written_after_the_interval(database):
+    buffer = AuditBuffer()
+    buffer.FLUSH_INTERVAL = 0.01
+    rows = _rows(2)
+    for row in rows:
+        buffer.put(row)
+
+    await _run_until_written(buffer, database)
+
+    assert database.batches == [rows]
+
+
+async def test_failed_write_is_retried_without_losing_rows(database):
+    database.failures = 1
+    buffer = AuditBuffer()
+    buffer.FLUSH_INTERVAL = 0.01
+    buffer.RETRY_DELAY = 0.01
+    rows = _rows(2)
+    for row in rows:
+        buffer.put(row)
+
+    await _run_until_written(buffer, database)
+
+    assert database.attempts == 2
+    assert database.batches == [rows]
+
+
+async def test_flush_writes_rows_still_queued_at_shutdown(database):
+    buffer = AuditBuffer()
+    rows = _rows(5)
+    for row in rows:
+        buffer.put(row)
+
+    await buffer.flush()
+
+    assert database.batches == [rows]
+
+
+async def test_flush_with_nothing_buffered_does_not_open_a_session(database):
+    await AuditBuffer().flush()
+
+    assert database.attempts == 0
+
+
+async def test_flush_retries_a_failed_write(database):
+    database.failures = 1
+    buffer = AuditBuffer()
+    buffer.RETRY_DELAY = 0
+    rows = _rows(2)
+    for row in rows:
+        buffer.put(row)
+
+    await buffer.flush()
+
+    assert database.batches == [rows]
+
+
+async def test_flush_gives_up_after_the_last_attempt(database):
+    database.failures = AuditBuffer.FLUSH_ATTEMPTS
+    buffer = AuditBuffer()
+    buffer.RETRY_DELAY = 0
+    buffer.put(_rows(1)[0])
+
+    await buffer.flush()
+
+    assert database.attempts == AuditBuffer.FLUSH_ATTEMPTS
+    assert database.batches == []
+    assert buffer._batch == []
+
+
+async def test_rows_beyond_max_queued_are_dropped(database, monkeypatch):
+    monkeypatch.setattr(AuditBuffer, "MAX_QUEUED", 2)
+    buffer = AuditBuffer()
+    rows = _rows(3)
+    for row in rows:
+        buffer.put(row)
+
+    await buffer.flush()
+
+    assert database.batches == [rows[:2]]
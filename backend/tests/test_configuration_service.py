@@ -0,0 +1,32 @@
+"""Tests for ConfigurationService startup-mode keyset pagination."""
+import pytest
+from fastapi import HTTPException
+
+from app.services.configuration_service import ConfigurationService
+from app.utils.pagination import encode_cursor
+
+
+class _UnusedSession:
+    """Session stand-in for code paths that must fail before touching the database."""
+
+    async def execute(self, *args, **kwargs):
+        raise AssertionError("the database must not be queried")
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        (["ios"], "100", "strict"),  # list os
+        ("ios", 100, "strict"),  # build is a String column
+        ("ios", "100", None),
+        ({"os": "ios"}, "100", "strict"),
+    ],
+)
+async def test_startup_mode_cursor_with_wrong_types_is_rejected(values):
+    service = ConfigurationService(_UnusedSession())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.list_startup_modes(mode="strict", cursor=encode_cursor(values))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid cursor"
@@ -0,0 +1,78 @@
+"""Tests for app.utils.pagination cursor helpers."""
+import base64
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.pagination import decode_cursor, encode_cursor, parse_cursor_datetime
+
+
+def _raw_cursor(payload: bytes) -> str:
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def test_round_trip_keeps_values_and_serializes_datetimes():
+    ts = datetime(2026, 10, 16, 8, 30, 15, 123456)
+
+    cursor = encode_cursor((ts, 42))
+
+    c_ts, c_id = decode_cursor(cursor, 2)
+    assert c_id == 42
+    assert parse_cursor_datetime(c_ts) == ts
+
+
+def test_cursor_is_url_safe_without_padding():
+    cursor = encode_cursor(("ios", "1.2.3", "strict"))
+
+    assert "=" not in cursor
+    assert "+" not in cursor and "/" not in cursor
+    assert decode_cursor(cursor, 3) == ["ios", "1.2.3", "strict"]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        "%%%%",
+        _raw_cursor(b"\xff\xfe\x00"),  # not UTF-8
+        _raw_cursor(b"{not json"),
+    ],
+)
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, 2)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Invalid cursor"
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b'{"id": 1}',  # not a list
+        b'"2026-10-16T00:00:00"',
+        b"[1]",  # too short
+        b"[1, 2, 3]",  # too long
+    ],
+)
+def test_cursor_with_wrong_shape_is_rejected(payload):
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(_raw_cursor(payload), 2)
+
+    assert exc_info.value.status_code == 400
+
+
+def test_cursor_encoded_for_another_sort_key_is_rejected():
+    cursor = encode_cursor(("ios", "100", "strict"))
+
+    with pytest.raises(HTTPException):
+        decode_cursor(cursor, 2)
+
+
+@pytest.mark.parametrize("value", [None, 1700000000, "yesterday", ["2026-10-16"]])
+def test_invalid_cursor_datetime_is_rejected(value):
+    with pytest.raises(HTTPException) as exc_info:
+        parse_cursor_datetime(value)
+
+    assert exc_info.value.status_code == 400
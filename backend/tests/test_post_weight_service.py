@@ -0,0 +1,189 @@
+"""Tests for PostWeightService.create_or_update."""
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.dml import Insert, Update
+
+from app.schemas.post_weight import PostWeightCreateRequest
+from app.services.post_weight_service import PostWeightService
+
+_PG = postgresql.dialect()
+NOW = datetime(2026, 10, 16, 12, 0, 0)
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def all(self):
+        return list(self._rows)
+
+    def scalars(self):
+        return self
+
+
+class FakeSession:
+    """Replays scripted results in call order and records what was executed."""
+
+    def __init__(self, *results):
+        self._results = list(results)
+        self.statements = []
+        self.events = []
+
+    async def execute(self, statement, params=None):
+        self.statements.append((statement, params))
+        self.events.append("execute")
+        return _Result(self._results.pop(0))
+
+    scalars = execute
+
+    async def commit(self):
+        self.events.append("commit")
+
+    async def rollback(self):
+        self.events.append("rollback")
+
+
+def _record(record_id, post_id):
+    return SimpleNamespace(
+        id=record_id,
+        post_url=f"https://app.example.com/post/{post_id}",
+        post_id=post_id,
+        weight=Decimal("2.5000"),
+        operator="op-1",
+        operator_name="Alice",
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def _sql(clause) -> str:
+    return " ".join(str(clause.compile(dialect=_PG)).split())
+
+
+@pytest.fixture
+def notified(monkeypatch):
+    calls = []
+
+    async def fake_notify(self, post_ids):
+        calls.append(list(post_ids))
+        self.db.events.append("notify")
+
+    monkeypatch.setattr(PostWeightService, "_notify_recommendation", fake_notify)
+    return calls
+
+
+def _payload(*urls):
+    return PostWeightCreateRequest(post_urls=list(urls), weight=2.5)
+
+
+async def test_updates_one_row_per_existing_post_and_inserts_the_rest(notified):
+    session = FakeSession(
+        ["p1", "p2"],  # Post existence check
+        [("p1", 7)],  # one target row per existing post_id
+        [_record(7, "p1")],  # UPDATE ... RETURNING
+        [_record(8, "p2")],  # INSERT ... RETURNING
+    )
+    service = PostWeightService(session)
+
+    result = await service.create_or_update(
+        _payload(
+            "https://app.example.com/post/p1",
+            "https://app.example.com/post/p2",
+            "https://app.example.com/post/p1/",  # same post_id, dropped
+        ),
+        operator_id="op-1",
+        operator_name="Alice",
+    )
+
+    assert [(item.id, item.post_id) for item in result] == [(7, "p1"), (8, "p2")]
+    assert result[0].operator_id == "op-1"
+    assert result[0].weight == 2.5
+
+    update_stmt = next(stmt for stmt, _ in session.statements if isinstance(stmt, Update))
+    where_sql = _sql(update_stmt.whereclause)
+    # The UPDATE targets primary keys, never every row sharing a post_id
+    assert "post_weights.id IN" in where_sql
+    assert "post_id" not in where_sql
+    assert [7] in update_stmt.whereclause.compile(dialect=_PG).params.values()
+
+    insert_rows = next(params for stmt, params in session.statements if isinstance(stmt, Insert))
+    assert [row["post_id"] for row in insert_rows] == ["p2"]
+    assert insert_rows[0]["operator_name"] == "Alice"
+
+    assert notified == [["p1", "p2"]]
+    assert session.events[-2:] == ["notify", "commit"]
+
+
+async def test_target_row_lookup_prefers_live_row_then_newest(notified):
+    session = FakeSession(["p1"], [("p1", 3)], [_record(3, "p1")])
+    service = PostWeightService(session)
+
+    await service.create_or_update(
+        _payload("https://app.example.com/post/p1"), operator_id="op-1", operator_name="Alice"
+    )
+
+    lookup_sql = _sql(session.statements[1][0])
+    assert "DISTINCT ON (post_weights.post_id)" in lookup_sql
+    assert lookup_sql.endswith(
+        "ORDER BY post_weights.post_id, post_weights.deleted_at IS NOT NULL, post_weights.id DESC"
+    )
+    # Everything already existed: no INSERT
+    assert not any(isinstance(stmt, Insert) for stmt, _ in session.statements)
+
+
+async def test_new_posts_are_only_inserted(notified):
+    session = FakeSession(["p9"], [], [_record(11, "p9")])
+    service = PostWeightService(session)
+
+    result = await service.create_or_update(
+        _payload("https://app.example.com/post/p9"), operator_id="op-1", operator_name="Alice"
+    )
+
+    assert [item.id for item in result] == [11]
+    assert not any(isinstance(stmt, Update) for stmt, _ in session.statements)
+
+
+async def test_unknown_post_is_rejected_before_writing(notified):
+    session = FakeSession(["p1"])
+    service = PostWeightService(session)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_or_update(
+            _payload("https://app.example.com/post/p1", "https://app.example.com/post/p2"),
+            operator_id="op-1",
+            operator_name="Alice",
+        )
+
+    assert exc_info.value.status_code == 404
+    assert "p2" in exc_info.value.detail
+    assert len(session.statements) == 1
+    assert "commit" not in session.events
+    assert notified == []
+
+
+@pytest.mark.parametrize(
+    "post_urls",
+    [
+        [],
+        " , ,",
+        ["https://app.example.com/"],  # no post_id segment
+    ],
+)
+async def test_invalid_urls_are_rejected(post_urls, notified):
+    session = FakeSession()
+    service = PostWeightService(session)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_or_update(
+            PostWeightCreateRequest(post_urls=post_urls, weight=1),
+            operator_id="op-1",
+            operator_name="Alice",
+        )
+
+    assert exc_info.value.status_code == 400
+    assert session.statements == []
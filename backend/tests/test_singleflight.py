@@ -0,0 +1,137 @@
+"""Tests for app.utils.singleflight.SingleFlight."""
+import asyncio
+
+import pytest
+
+from app.utils.singleflight import SingleFlight
+
+
+class _Call:
+    """Awaitable factory that blocks until released and counts invocations."""
+
+    def __init__(self, result="value"):
+        self.result = result
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        if isinstance(self.result, BaseException):
+            raise self.result
+        return self.result
+
+
+async def test_concurrent_callers_share_one_execution():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await call.started.wait()
+    followers = [asyncio.create_task(flight.do("key", call)) for _ in range(5)]
+    await asyncio.sleep(0)
+    call.release.set()
+
+    results = await asyncio.gather(leader, *followers)
+
+    assert results == ["value"] * 6
+    assert call.calls == 1
+
+
+async def test_different_keys_run_independently():
+    flight: SingleFlight[str] = SingleFlight()
+    first, second = _Call("a"), _Call("b")
+    first.release.set()
+    second.release.set()
+
+    results = await asyncio.gather(flight.do("a", first), flight.do("b", second))
+
+    assert results == ["a", "b"]
+    assert (first.calls, second.calls) == (1, 1)
+
+
+async def test_result_is_not_cached_after_completion():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+    call.release.set()
+
+    await flight.do("key", call)
+    await flight.do("key", call)
+
+    assert call.calls == 2
+
+
+async def test_leader_exception_reaches_followers_and_clears_key():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call(ValueError("boom"))
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await call.started.wait()
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+    call.release.set()
+
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert [type(r) for r in results] == [ValueError, ValueError]
+    assert call.calls == 1
+
+    retry = _Call("recovered")
+    retry.release.set()
+    assert await flight.do("key", retry) == "recovered"
+
+
+async def test_follower_runs_its_own_call_when_leader_is_cancelled():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await call.started.wait()
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    call.release.set()
+
+    assert await follower == "value"
+    assert call.calls == 2
+
+
+async def test_cancelled_follower_does_not_affect_leader():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await call.started.wait()
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+
+    follower.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await follower
+    call.release.set()
+
+    assert await leader == "value"
+    assert call.calls == 1
+
+
+async def test_follower_cancelled_together_with_leader_stays_cancelled():
+    flight: SingleFlight[str] = SingleFlight()
+    call = _Call()
+
+    leader = asyncio.create_task(flight.do("key", call))
+    await call.started.wait()
+    follower = asyncio.create_task(flight.do("key", call))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    follower.cancel()
+    results = await asyncio.gather(leader, follower, return_exceptions=True)
+
+    assert all(isinstance(r, asyncio.CancelledError) for r in results)
+    # The follower must not start a retry of its own
+    assert call.calls == 1